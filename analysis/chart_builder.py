@@ -2,26 +2,57 @@
 chart_builder.py
 Purpose: format chart-ready data for the frontend.
 Pseudocode:
-1) Build a set of touch indices.
-2) For each row, emit a minimal dict with date/close/bands.
+1) Pull date/close/band columns out as NumPy arrays once.
+2) Map NaN band values to None and build a positional touch mask.
+3) Return them as columns, or zip the columns into a minimal dict per row.
 """
+import numpy as np
 import pandas as pd
 
+_CHART_KEYS = ('date', 'close', 'upper', 'lower', 'isTouch')
+
+
+def _column_or_none(data: pd.DataFrame, col: str) -> list:
+    """Return a column as native floats with NaN mapped to None (all None when missing)."""
+    if col not in data.columns:
+        return [None] * len(data)
+    values = data[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.where(np.isnan(values), None, values).tolist()
+
+
+def _date_strings(data: pd.DataFrame) -> list:
+    """Format the date column as YYYY-MM-DD strings in one vectorized call."""
+    dates = data['date']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, cache=True)
+    return dates.dt.strftime('%Y-%m-%d').tolist()
+
+
+def build_chart_columns(data, touches) -> dict:
+    """Return chart data as parallel lists keyed by field (date/close/upper/lower/isTouch)."""
+    n = len(data)
+    touch_mask = np.zeros(n, dtype=np.bool_)
+    touch_idx = np.fromiter((t['index'] for t in touches), dtype=np.int64, count=len(touches))
+    # Out-of-range indices mark nothing (negative ones would count from the end).
+    touch_mask[touch_idx[(touch_idx >= 0) & (touch_idx < n)]] = True
+
+    return {
+        'date': _date_strings(data),
+        'close': data['close'].to_numpy(dtype=np.float64).tolist(),
+        'upper': _column_or_none(data, 'BB_upper'),
+        'lower': _column_or_none(data, 'BB_lower'),
+        'isTouch': touch_mask.tolist(),
+    }
+
+
+def to_row_dicts(columns: dict) -> list:
+    """Convert a columnar chart payload into one dict per point."""
+    return [
+        dict(zip(_CHART_KEYS, row))
+        for row in zip(*(columns[key] for key in _CHART_KEYS))
+    ]
+
+
 def build_chart_data(data, touches) -> list:
     """Return a list of chart points with optional touch markers."""
-    n = len(data)
-    touch_indices = {t['index'] for t in touches}
-    
-    chart_data = []
-    for i in range(n):
-        row = data.iloc[i]
-        upper = row.get('BB_upper')
-        lower = row.get('BB_lower')
-        chart_data.append({
-            'date': row['date'].strftime('%Y-%m-%d'),
-            'close': float(row['close']),
-            'upper': float(upper) if upper is not None and not pd.isna(upper) else None,
-            'lower': float(lower) if lower is not None and not pd.isna(lower) else None,
-            'isTouch': (i in touch_indices),
-        })
-    return chart_data
+    return to_row_dicts(build_chart_columns(data, touches))
@@ -6,14 +6,33 @@ Pseudocode:
 2) Fetch data + indicators.
 3) Detect band touches on the latest candle for each symbol.
 """
+import time
 from datetime import datetime
-import pytz
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
 from .data_preparation import prepare_stock_data
 from database.ticker_repository import get_all_tickers
 from .event_detection import process_bollinger_touches
 
-_CHICAGO_TZ = pytz.timezone("America/Chicago")
+_CHICAGO_TZ = ZoneInfo("America/Chicago")
+_TICKERS_TTL_SECONDS = 300
+
+
+@lru_cache(maxsize=1)
+def _tickers_cached(bucket: int) -> tuple:
+    """Ticker list for one TTL bucket; a new bucket evicts the old entry."""
+    del bucket  # only part of the cache key
+    return tuple(get_all_tickers())
+
+
+def _clear_scan_tickers_cache() -> None:
+    _tickers_cached.cache_clear()
+
+
+def _get_scan_tickers() -> list:
+    return list(_tickers_cached(int(time.time() // _TICKERS_TTL_SECONDS)))
+
 
 def daily_scan():
     """
@@ -21,7 +40,7 @@ def daily_scan():
     """
     timestamp = datetime.now(_CHICAGO_TZ).strftime('%Y-%m-%d %H:%M:%S')
 
-    tickers = get_all_tickers()
+    tickers = _get_scan_tickers()
     data_dict = prepare_stock_data(tickers)
     touched_details = process_bollinger_touches(data_dict, mode='alert')
 
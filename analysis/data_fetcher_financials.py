@@ -2,23 +2,111 @@
 data_fetcher_financials.py
 Purpose: fetch financial statements from Alpha Vantage or the database.
 """
+import heapq
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from database.financials_repository import get_financial_statement, upsert_financial_statement
-from .data_fetcher_utils import normalize_symbol
+from database.financials_repository import get_financial_statements, upsert_financial_statement
+from .data_fetcher_utils import normalize_symbol, parse_non_negative_int_env
 from .financials_alpha import is_alpha_vantage_error, has_financial_reports
 from .financials_helpers import compute_annual_from_quarters, compute_partial_year_reports
 from .financials_yfinance import get_fiscal_quarter_info
+from .ttl_cache import TTLCache
+
+try:
+    import h2  # noqa: F401  # HTTP/2 support for httpx
+    import httpx
+except Exception:  # pragma: no cover - optional dependency guard
+    httpx = None
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency guard
+    orjson = None
 
 load_dotenv()
 
 alpha_vantage_api_key = os.environ.get("alpha_vantage_api_key")
 _DEFAULT_MAX_QUARTERLY_AGE_DAYS = 90
 _DEFAULT_MAX_ANNUAL_AGE_DAYS = 370
+_DEFAULT_CACHE_TTL_SECONDS = 6 * 60 * 60
+_DEFAULT_EMPTY_CACHE_TTL_SECONDS = 5 * 60
+_AV_URL = "https://www.alphavantage.co/query"
+# statement name -> Alpha Vantage function
+_VALID_TYPES = {
+    "income_statement": "INCOME_STATEMENT",
+    "balance_sheet": "BALANCE_SHEET",
+    "cash_flow": "CASH_FLOW",
+}
+_REQUESTED_ALL = tuple(_VALID_TYPES)
+_VALID_TYPES_STR = ", ".join(_REQUESTED_ALL)
+
+# (symbol, statement) -> payload. Each entry carries its own expiry: long
+# for statements with reports, short for empty ones. Payloads are shared
+# between callers, who only read them; hits hand back a shallow top-level copy.
+_FINANCIALS_CACHE = TTLCache(ttl_seconds=_DEFAULT_CACHE_TTL_SECONDS)
+# (symbol, statement) pairs the DB had no row for. Only consulted when
+# Alpha Vantage will not be called (no api key, or the symbol's breaker is
+# open): those requests fail without landing in _FINANCIALS_CACHE, so
+# without this every retry would pay the DB round trip again. Requests
+# that may call Alpha Vantage always re-read the DB, since another worker
+# may have written the row. Cleared for a key once it is upserted.
+_DB_MISS_CACHE = TTLCache(ttl_seconds=60, max_size=2048)
+# symbol -> (failure count, monotonic time of the first failure). Symbols
+# Alpha Vantage keeps rejecting ("Error Message") or answering without
+# reports skip the API for an hour once the threshold is hit within the
+# window. A request counts once however many statements failed.
+# Rate-limit notes and network errors are not the symbol's fault and do
+# not count.
+_AV_SYMBOL_FAILS = TTLCache(ttl_seconds=60 * 60, max_size=4096)
+_AV_SYMBOL_FAILS_LOCK = threading.Lock()
+_AV_SYMBOL_FAIL_THRESHOLD = 5
+_AV_SYMBOL_FAIL_WINDOW_SECONDS = 10 * 60
+
+
+def _build_av_session():
+    """
+    Shared keep-alive client for Alpha Vantage.
+    With httpx[http2] installed the statement requests for a symbol are
+    multiplexed over one HTTP/2 connection; otherwise a pooled requests
+    session with a small retry budget is used. Both expose get(url, timeout=).
+    """
+    if httpx is not None:
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=64),
+        )
+        return httpx.Client(timeout=8.0, transport=transport)
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_AV_SESSION = _build_av_session()
+# Bulk fundamentals fan out over symbols and each symbol over statements;
+# cap the Alpha Vantage requests in flight across all of them.
+_AV_MAX_CONCURRENCY = max(1, parse_non_negative_int_env("alpha_vantage_max_concurrency", 5))
+_AV_CONCURRENCY = threading.BoundedSemaphore(_AV_MAX_CONCURRENCY)
 
 
 def _alpha_error_message(payload: dict) -> str:
@@ -32,15 +120,44 @@ def _alpha_error_message(payload: dict) -> str:
     )
 
 
-def _parse_max_age_days(env_key: str, default_days: int) -> int:
-    raw = os.environ.get(env_key)
-    if raw is None:
-        return default_days
-    try:
-        days = int(raw)
-    except (TypeError, ValueError):
-        return default_days
-    return max(days, 0)
+def _clear_financials_cache() -> None:
+    _FINANCIALS_CACHE.clear()
+    _DB_MISS_CACHE.clear()
+    _AV_SYMBOL_FAILS.clear()
+
+
+class _AlphaVantageSymbolError(ValueError):
+    """Alpha Vantage rejected the symbol itself ("Error Message")."""
+
+
+def _record_av_symbol_outcome(symbol: str, outcomes: set) -> None:
+    """Fold one request's Alpha Vantage outcomes into the symbol's breaker."""
+    if "ok" in outcomes:
+        _AV_SYMBOL_FAILS.discard(symbol)
+        return
+    if "failed" not in outcomes:
+        return
+    with _AV_SYMBOL_FAILS_LOCK:
+        now = time.monotonic()
+        count, first_failed_at = _AV_SYMBOL_FAILS.get(symbol, (0, now))
+        if now - first_failed_at > _AV_SYMBOL_FAIL_WINDOW_SECONDS:
+            count, first_failed_at = 0, now
+        _AV_SYMBOL_FAILS.set(symbol, (count + 1, first_failed_at))
+
+
+def _av_symbol_blocked(symbol: str) -> bool:
+    count, _ = _AV_SYMBOL_FAILS.get(symbol, (0, 0.0))
+    return count >= _AV_SYMBOL_FAIL_THRESHOLD
+
+
+def _cache_get(key):
+    payload = _FINANCIALS_CACHE.get(key)
+    return dict(payload) if payload is not None else None
+
+
+def _cache_set(key, payload, ttl_seconds: int) -> None:
+    if isinstance(payload, dict):
+        _FINANCIALS_CACHE.set(key, payload, ttl=ttl_seconds)
 
 
 def _utc_today() -> date:
@@ -51,7 +168,7 @@ def _parse_fiscal_date(value: str):
     if not isinstance(value, str):
         return None
     try:
-        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+        return date.fromisoformat(value[:10])
     except ValueError:
         return None
 
@@ -62,15 +179,18 @@ def _latest_report_date(payload: dict, key: str):
     reports = payload.get(key) or []
     if not isinstance(reports, list):
         return None
-    dates = []
-    for report in reports:
-        if not isinstance(report, dict):
-            continue
-        date_str = report.get("fiscalDateEnding")
+    # ISO dates order as strings, so only the newest candidates get parsed;
+    # usually that is just the first one.
+    date_strs = [
+        report.get("fiscalDateEnding")
+        for report in reports
+        if isinstance(report, dict) and isinstance(report.get("fiscalDateEnding"), str)
+    ]
+    for date_str in sorted(date_strs, key=lambda value: value[:10], reverse=True):
         parsed = _parse_fiscal_date(date_str)
         if parsed is not None:
-            dates.append(parsed)
-    return max(dates) if dates else None
+            return parsed
+    return None
 
 
 def _attach_quarter_info(payload, quarter_info):
@@ -83,13 +203,19 @@ def _attach_quarter_info(payload, quarter_info):
     return payload
 
 
-def _is_fresh_by_reports(payload: dict, max_quarterly_age_days: int, max_annual_age_days: int) -> bool:
-    if not isinstance(payload, dict):
-        return False
+def _is_fresh_by_reports(
+    quarterly_date,
+    annual_date,
+    max_quarterly_age_days: int,
+    max_annual_age_days: int,
+    latest_reported_quarter=None,
+) -> bool:
+    """
+    latest_reported_quarter is the issuer's most recent quarter end per
+    yfinance. Stored quarters already at or past it cannot be newer on
+    Alpha Vantage, so they stay fresh past the day cap, up to twice that.
+    """
     today = _utc_today()
-    quarterly_date = _latest_report_date(payload, "quarterlyReports")
-    annual_date = _latest_report_date(payload, "annualReports")
-
     has_any = quarterly_date is not None or annual_date is not None
     if not has_any:
         return False
@@ -97,7 +223,12 @@ def _is_fresh_by_reports(payload: dict, max_quarterly_age_days: int, max_annual_
     if quarterly_date is not None:
         age = today - quarterly_date
         if age > timedelta(days=max_quarterly_age_days):
-            return False
+            caught_up = (
+                latest_reported_quarter is not None
+                and quarterly_date >= latest_reported_quarter
+            )
+            if not caught_up or age > timedelta(days=2 * max_quarterly_age_days):
+                return False
 
     if annual_date is not None:
         age = today - annual_date
@@ -107,38 +238,44 @@ def _is_fresh_by_reports(payload: dict, max_quarterly_age_days: int, max_annual_
     return True
 
 
+def _decode_json(response):
+    # Statement payloads run to a few hundred KB; orjson parses them several
+    # times faster than the stdlib decoder behind response.json().
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _fiscal_date_key(report: dict) -> str:
+    return report.get("fiscalDateEnding", "")
+
+
 def _fetch_alpha_vantage_statement(symbol: str, statement: str, function_name: str) -> dict:
-    url = (
-        "https://www.alphavantage.co/query"
-        f"?function={function_name}&symbol={symbol}&apikey={alpha_vantage_api_key}"
-    )
-    response = requests.get(url, timeout=8)
+    params = {"function": function_name, "symbol": symbol, "apikey": alpha_vantage_api_key}
+    with _AV_CONCURRENCY:
+        response = _AV_SESSION.get(_AV_URL, params=params, timeout=8)
     if response.status_code != 200:
         raise Exception(f"Error fetching {statement} data: {response.status_code}")
 
-    data = response.json()
+    data = _decode_json(response)
     if not isinstance(data, dict):
         data = {}
     if is_alpha_vantage_error(data):
+        if "Error Message" in data:
+            raise _AlphaVantageSymbolError(_alpha_error_message(data))
         raise ValueError(_alpha_error_message(data))
 
     if "annualReports" in data:
         if isinstance(data["annualReports"], list):
-            data["annualReports"] = sorted(
-                data["annualReports"],
-                key=lambda x: x.get("fiscalDateEnding", ""),
-                reverse=True,
-            )[:3]
+            data["annualReports"] = heapq.nlargest(3, data["annualReports"], key=_fiscal_date_key)
         else:
             data["annualReports"] = []
 
     if "quarterlyReports" in data:
         if isinstance(data["quarterlyReports"], list):
-            data["quarterlyReports"] = sorted(
-                data["quarterlyReports"],
-                key=lambda x: x.get("fiscalDateEnding", ""),
-                reverse=True,
-            )[:12]
+            data["quarterlyReports"] = heapq.nlargest(
+                12, data["quarterlyReports"], key=_fiscal_date_key
+            )
         else:
             data["quarterlyReports"] = []
 
@@ -155,26 +292,123 @@ def _fetch_alpha_vantage_statement(symbol: str, statement: str, function_name: s
     return data
 
 
-def fetch_financials(symbol: str, statements=None) -> dict:
+def _load_db_statements(symbol: str, statements, skip_recent_misses: bool) -> dict:
+    """Read the stored statements in one DB round trip, optionally skipping recent misses."""
+    wanted = list(statements)
+    if skip_recent_misses:
+        wanted = [s for s in wanted if _DB_MISS_CACHE.get((symbol, s)) is None]
+    if not wanted:
+        return {}
+    try:
+        payloads = get_financial_statements(symbol, wanted) or {}
+    except Exception:
+        return {}
+    for statement in wanted:
+        if not isinstance(payloads.get(statement), dict):
+            _DB_MISS_CACHE.set((symbol, statement), True)
+    return payloads
+
+
+def _resolve_statement(
+    symbol: str,
+    statement: str,
+    function_name: str,
+    db_payload,
+    quarter_info: dict,
+    max_quarterly_age_days: int,
+    max_annual_age_days: int,
+    av_outcomes: set,
+) -> dict:
+    """
+    Return one statement from the DB when fresh, else from Alpha Vantage.
+    Adds "ok" or "failed" to av_outcomes when Alpha Vantage answered for the symbol.
+    """
+    db_has_reports = False
+    db_quarterly = db_annual = None
+    if isinstance(db_payload, dict):
+        if db_payload.get("symbol") is None:
+            db_payload["symbol"] = symbol
+        db_has_reports = has_financial_reports(db_payload)
+        if db_has_reports:
+            # Parsed once; reused below when comparing against the API payload.
+            db_quarterly = _latest_report_date(db_payload, "quarterlyReports")
+            db_annual = _latest_report_date(db_payload, "annualReports")
+            if _is_fresh_by_reports(
+                db_quarterly,
+                db_annual,
+                max_quarterly_age_days,
+                max_annual_age_days,
+                _parse_fiscal_date((quarter_info or {}).get("mostRecentQuarter")),
+            ):
+                return _attach_quarter_info(db_payload, quarter_info)
+
+    if not alpha_vantage_api_key:
+        if db_has_reports:
+            return _attach_quarter_info(db_payload, quarter_info)
+        raise ValueError("Missing 'alpha_vantage_api_key' in environment")
+
+    if _av_symbol_blocked(symbol):
+        if db_has_reports:
+            return _attach_quarter_info(db_payload, quarter_info)
+        raise ValueError(f"Alpha Vantage has no {statement} data for {symbol}; retrying later.")
+
+    try:
+        data = _fetch_alpha_vantage_statement(symbol, statement, function_name)
+    except Exception as exc:
+        if isinstance(exc, _AlphaVantageSymbolError):
+            av_outcomes.add("failed")
+        if db_has_reports:
+            return _attach_quarter_info(db_payload, quarter_info)
+        raise
+
+    if not has_financial_reports(data):
+        av_outcomes.add("failed")
+        return _attach_quarter_info(db_payload or data, quarter_info)
+
+    av_outcomes.add("ok")
+    api_quarterly = _latest_report_date(data, "quarterlyReports")
+    api_annual = _latest_report_date(data, "annualReports")
+
+    should_use_api = not db_has_reports
+    if db_has_reports:
+        has_newer_quarterly = (
+            api_quarterly is not None
+            and (db_quarterly is None or api_quarterly > db_quarterly)
+        )
+        has_newer_annual = (
+            api_annual is not None
+            and (db_annual is None or api_annual > db_annual)
+        )
+        should_use_api = has_newer_quarterly or has_newer_annual
+    if not should_use_api:
+        return _attach_quarter_info(db_payload, quarter_info)
+
+    try:
+        upsert_financial_statement(symbol, statement, data, source="alpha_vantage")
+    except Exception:
+        pass
+    else:
+        _DB_MISS_CACHE.discard((symbol, statement))
+    return _attach_quarter_info(data, quarter_info)
+
+
+def fetch_financials(symbol: str, statements=None, bypass_cache: bool = False) -> dict:
     """
     Fetch financial statements (income, balance sheet, cash flow).
+    Multiple statements are resolved concurrently over the shared session,
+    and resolved statements are served from an in-process TTL cache.
+    bypass_cache skips cache lookups (the fresh result is still cached).
     """
     symbol = normalize_symbol(symbol)
-    max_quarterly_age_days = _parse_max_age_days(
+    max_quarterly_age_days = parse_non_negative_int_env(
         "financials_max_quarterly_age_days", _DEFAULT_MAX_QUARTERLY_AGE_DAYS
     )
-    max_annual_age_days = _parse_max_age_days(
+    max_annual_age_days = parse_non_negative_int_env(
         "financials_max_annual_age_days", _DEFAULT_MAX_ANNUAL_AGE_DAYS
     )
 
-    valid_types = {
-        "income_statement": "INCOME_STATEMENT",
-        "balance_sheet": "BALANCE_SHEET",
-        "cash_flow": "CASH_FLOW",
-    }
-
     if statements is None:
-        requested_types = list(valid_types.keys())
+        requested_types = _REQUESTED_ALL
     else:
         if isinstance(statements, str):
             requested_types = [statements]
@@ -184,72 +418,67 @@ def fetch_financials(symbol: str, statements=None) -> dict:
             raise ValueError("`statements` must be a string or a list of strings")
 
     for statement in requested_types:
-        if statement not in valid_types:
+        if statement not in _VALID_TYPES:
             raise ValueError(
-                f"Invalid statement type: {statement}. Valid options are: {list(valid_types.keys())}"
+                f"Invalid statement type: {statement}. Valid options are: {_VALID_TYPES_STR}"
             )
 
-    quarter_info = get_fiscal_quarter_info(symbol)
-    financials = {}
-    for statement in requested_types:
-        db_payload = None
-        try:
-            db_payload = get_financial_statement(symbol, statement)
-        except Exception:
-            db_payload = None
-
-        db_has_reports = False
-        if isinstance(db_payload, dict):
-            if db_payload.get("symbol") is None:
-                db_payload["symbol"] = symbol
-            db_has_reports = has_financial_reports(db_payload)
-            if db_has_reports and _is_fresh_by_reports(
-                db_payload, max_quarterly_age_days, max_annual_age_days
-            ):
-                financials[statement] = _attach_quarter_info(db_payload, quarter_info)
-                continue
-
-        if not alpha_vantage_api_key:
-            if db_has_reports:
-                financials[statement] = _attach_quarter_info(db_payload, quarter_info)
-                continue
-            raise ValueError("Missing 'alpha_vantage_api_key' in environment")
-
-        function_name = valid_types[statement]
-        try:
-            data = _fetch_alpha_vantage_statement(symbol, statement, function_name)
-        except Exception:
-            if db_has_reports:
-                financials[statement] = _attach_quarter_info(db_payload, quarter_info)
-                continue
-            raise
-
-        if has_financial_reports(data):
-            api_quarterly = _latest_report_date(data, "quarterlyReports")
-            api_annual = _latest_report_date(data, "annualReports")
-            db_quarterly = _latest_report_date(db_payload, "quarterlyReports") if db_has_reports else None
-            db_annual = _latest_report_date(db_payload, "annualReports") if db_has_reports else None
-
-            should_use_api = not db_has_reports
-            if db_has_reports:
-                has_newer_quarterly = (
-                    api_quarterly is not None
-                    and (db_quarterly is None or api_quarterly > db_quarterly)
-                )
-                has_newer_annual = (
-                    api_annual is not None
-                    and (db_annual is None or api_annual > db_annual)
-                )
-                should_use_api = has_newer_quarterly or has_newer_annual
-            if should_use_api:
-                try:
-                    upsert_financial_statement(symbol, statement, data, source="alpha_vantage")
-                except Exception:
-                    pass
-                financials[statement] = _attach_quarter_info(data, quarter_info)
-            else:
-                financials[statement] = _attach_quarter_info(db_payload, quarter_info)
+    cache_ttl_seconds = parse_non_negative_int_env(
+        "financials_cache_ttl_seconds", _DEFAULT_CACHE_TTL_SECONDS
+    )
+    empty_cache_ttl_seconds = min(
+        cache_ttl_seconds,
+        parse_non_negative_int_env(
+            "financials_empty_cache_ttl_seconds", _DEFAULT_EMPTY_CACHE_TTL_SECONDS
+        ),
+    )
+    results = {}
+    missing = []
+    for statement in dict.fromkeys(requested_types):
+        cached = None if bypass_cache else _cache_get((symbol, statement))
+        if cached is None:
+            missing.append(statement)
         else:
-            financials[statement] = _attach_quarter_info(db_payload or data, quarter_info)
+            results[statement] = cached
+    if not missing:
+        return results
 
-    return financials
+    quarter_info = get_fiscal_quarter_info(symbol)
+    db_payloads = _load_db_statements(
+        symbol,
+        missing,
+        skip_recent_misses=not alpha_vantage_api_key or _av_symbol_blocked(symbol),
+    )
+    av_outcomes = set()
+
+    def _resolve(statement):
+        db_payload = db_payloads.get(statement)
+        payload = _resolve_statement(
+            symbol,
+            statement,
+            _VALID_TYPES[statement],
+            db_payload if isinstance(db_payload, dict) else None,
+            quarter_info,
+            max_quarterly_age_days,
+            max_annual_age_days,
+            av_outcomes,
+        )
+        ttl_seconds = (
+            cache_ttl_seconds if has_financial_reports(payload) else empty_cache_ttl_seconds
+        )
+        _cache_set((symbol, statement), payload, ttl_seconds)
+        return dict(payload) if isinstance(payload, dict) else payload
+
+    try:
+        if len(missing) == 1:
+            results[missing[0]] = _resolve(missing[0])
+        else:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                futures = [
+                    (statement, executor.submit(_resolve, statement)) for statement in missing
+                ]
+                for statement, future in futures:
+                    results[statement] = future.result()
+    finally:
+        _record_av_symbol_outcome(symbol, av_outcomes)
+    return {statement: results[statement] for statement in requested_types}
@@ -3,11 +3,14 @@ data_fetcher_fundamentals.py
 Purpose: fetch fundamentals and peers from yfinance and Finnhub.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 import finnhub
-import yfinance as yf
 from dotenv import load_dotenv
 from .data_fetcher_utils import (
     normalize_symbol,
+    parse_non_negative_int_env,
     symbol_candidates,
     safe_float,
     get_info_value,
@@ -15,12 +18,33 @@ from .data_fetcher_utils import (
     get_fast_info,
     get_price_from_history,
 )
+from . import json_store
+from .ttl_cache import TTLCache
+from .yfinance_tickers import get_ticker
 
 load_dotenv()
 
 finnhub_api_key = os.environ.get("finnhub_api_key")
 finnhub_client = finnhub.Client(api_key=finnhub_api_key)
 
+# Valuation fields move at most daily and peer lists far less often;
+# repeat lookups for a symbol within the TTL skip the Yahoo/Finnhub round
+# trips. Only non-empty results are cached so unknown or failing symbols
+# are retried. With JSON_CACHE_DIR set, results are also written to disk
+# (same TTLs) so restarts and sibling worker processes reuse them.
+_DEFAULT_CACHE_TTL_SECONDS = 60 * 60
+_DEFAULT_PEERS_CACHE_TTL_SECONDS = 24 * 60 * 60
+_FUNDAMENTALS_CACHE = TTLCache(ttl_seconds=_DEFAULT_CACHE_TTL_SECONDS)
+_PEERS_CACHE = TTLCache(ttl_seconds=_DEFAULT_PEERS_CACHE_TTL_SECONDS)
+
+def _cache_ttl_seconds() -> int:
+    return parse_non_negative_int_env("fundamentals_cache_ttl_seconds", _DEFAULT_CACHE_TTL_SECONDS)
+
+
+def _clear_fundamentals_cache() -> None:
+    _FUNDAMENTALS_CACHE.clear()
+    _PEERS_CACHE.clear()
+
 def _extract_fundamentals(info, fast_info, price_fallback=None):
     def info_float(keys):
         return safe_float(get_info_value(info, keys))
@@ -92,9 +116,12 @@ def _extract_fundamentals(info, fast_info, price_fallback=None):
 
 def load_fundamentals(symbol_override: str, include_alpha: bool = True) -> dict:
     try:
-        ticker = yf.Ticker(symbol_override)
+        ticker = get_ticker(symbol_override)
         info = get_ticker_info(ticker)
         fast_info = get_fast_info(ticker)
+        if not info and not fast_info:
+            # Unknown symbol: skip the history call and let the caller try the next candidate.
+            return {}
         price_fallback = get_price_from_history(ticker)
     except Exception:
         return {}
@@ -123,25 +150,78 @@ def fetch_stock_fundamentals(symbol: str, include_alpha: bool = True) -> dict:
     Fetch fundamentals and compute key ratios.
     """
     symbol = normalize_symbol(symbol)
+    cached = _FUNDAMENTALS_CACHE.get(symbol)
+    if cached is not None:
+        return dict(cached)
+    stored = json_store.load("fundamentals", symbol, _cache_ttl_seconds())
+    if stored is not None and isinstance(stored[0], dict) and stored[0]:
+        _FUNDAMENTALS_CACHE.set(symbol, stored[0], ttl=stored[1])
+        return dict(stored[0])
 
     fundamentals = {}
     for candidate in symbol_candidates(symbol):
         fundamentals = load_fundamentals(candidate, include_alpha=include_alpha)
         if not is_empty_fundamentals(fundamentals):
-            break
+            _FUNDAMENTALS_CACHE.set(symbol, fundamentals, ttl=_cache_ttl_seconds())
+            json_store.save("fundamentals", symbol, fundamentals)
+            return dict(fundamentals)
 
     return fundamentals
 
 
-def fetch_peers(symbol: str) -> list:
+def fetch_stock_fundamentals_bulk(
+    symbols,
+    include_alpha: bool = True,
+    max_workers: Optional[int] = None,
+) -> dict:
+    """
+    Fetch fundamentals for many symbols, overlapping the per-symbol Yahoo calls.
+    Returns {symbol: fundamentals}; failures map to {}.
+    """
+    unique = list(dict.fromkeys(sym for sym in (symbols or []) if sym))
+    if not unique:
+        return {}
+
+    if max_workers is None:
+        max_workers = min(8, len(unique))
+    else:
+        max_workers = max(1, min(max_workers, len(unique)))
+
+    def _safe_fetch(sym):
+        try:
+            return fetch_stock_fundamentals(sym, include_alpha=include_alpha)
+        except Exception:
+            return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(unique, executor.map(_safe_fetch, unique)))
+
+
+def fetch_peers(symbol: str, bypass_cache: bool = False) -> list:
     """
     Fetch peer tickers for a given symbol using Finnhub.
+    bypass_cache skips the cache lookup (the fresh result is still cached).
     """
+    cache_key = normalize_symbol(symbol)
+    ttl_seconds = parse_non_negative_int_env(
+        "peers_cache_ttl_seconds", _DEFAULT_PEERS_CACHE_TTL_SECONDS
+    )
+    if not bypass_cache:
+        cached = _PEERS_CACHE.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        stored = json_store.load("peers", cache_key, ttl_seconds)
+        if stored is not None and isinstance(stored[0], list) and stored[0]:
+            _PEERS_CACHE.set(cache_key, stored[0], ttl=stored[1])
+            return list(stored[0])
+
     for candidate in symbol_candidates(symbol):
         try:
             peers = finnhub_client.company_peers(candidate)
         except Exception:
             peers = None
         if isinstance(peers, list) and peers:
-            return peers
+            _PEERS_CACHE.set(cache_key, peers, ttl=ttl_seconds)
+            json_store.save("peers", cache_key, peers)
+            return list(peers)
     return []
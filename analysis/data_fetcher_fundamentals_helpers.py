@@ -1,23 +1,6 @@
 import pandas as pd
 
-from .data_fetcher_utils import _month_to_quarter, _normalize_line_name
-
-
-def safe_float(value):
-    try:
-        if value is None:
-            return None
-        if isinstance(value, str):
-            cleaned = value.strip()
-            if not cleaned or cleaned.lower() in ("none", "nan", "na", "n/a", "null"):
-                return None
-            value = cleaned.replace(",", "")
-        value = float(value)
-    except Exception:
-        return None
-    if value != value or value in (float("inf"), float("-inf")):
-        return None
-    return value
+from .data_fetcher_utils import _month_to_quarter, _normalize_line_name, safe_float
 
 
 def safe_div(numerator, denominator):
@@ -1,8 +1,42 @@
-import yfinance as yf
-
 from .data_fetcher_financials import fetch_financials
 from .data_fetcher_fundamentals_extract import extract_fundamentals
-from .data_fetcher_utils import get_fast_info, get_price_from_history, get_ticker_info
+from .data_fetcher_utils import (
+    get_fast_info,
+    get_price_from_history,
+    get_ticker_info,
+    parse_non_negative_int_env,
+)
+from .ttl_cache import TTLCache
+from .yfinance_tickers import get_ticker
+
+# ticker.info is a ~200-key Yahoo scrape and the same symbols are loaded
+# repeatedly, so keep each blob for a while. Only the price keys are
+# dropped before caching, so the price is refilled from history/fast_info on
+# every load. Quote-derived fields (trailingPE, forwardPE, marketCap,
+# dividendYield, ...) are served from the cached blob and can lag the live
+# quote by up to the TTL.
+_DEFAULT_INFO_CACHE_TTL_SECONDS = 60 * 60
+_INFO_CACHE = TTLCache(ttl_seconds=_DEFAULT_INFO_CACHE_TTL_SECONDS)
+_LIVE_QUOTE_KEYS = ("currentPrice", "regularMarketPrice")
+
+
+def _clear_info_cache() -> None:
+    _INFO_CACHE.clear()
+
+
+def _cached_ticker_info(symbol, ticker) -> dict:
+    # Callers add keys to the returned dict, so hits and stores are copies.
+    cached = _INFO_CACHE.get(symbol)
+    if cached is not None:
+        return dict(cached)
+    info = get_ticker_info(ticker)
+    if info:
+        stored = {key: value for key, value in info.items() if key not in _LIVE_QUOTE_KEYS}
+        ttl_seconds = parse_non_negative_int_env(
+            "ticker_info_cache_ttl_seconds", _DEFAULT_INFO_CACHE_TTL_SECONDS
+        )
+        _INFO_CACHE.set(symbol, stored, ttl=ttl_seconds)
+    return info
 
 
 def _safe_attr(ticker, attr):
@@ -13,8 +47,8 @@ def _safe_attr(ticker, attr):
 
 
 def load_fundamentals(symbol_override, include_alpha=True):
-    ticker = yf.Ticker(symbol_override)
-    info = get_ticker_info(ticker)
+    ticker = get_ticker(symbol_override)
+    info = _cached_ticker_info(symbol_override, ticker)
     fast_info = get_fast_info(ticker)
     price = get_price_from_history(ticker)
     if price is not None:
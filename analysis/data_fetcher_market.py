@@ -3,14 +3,19 @@ data_fetcher_market.py
 Purpose: fetch OHLCV data and option chains from yfinance.
 """
 import os
+import re
 import threading
 import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
 import yfinance as yf
 
+from . import ohlc_store
 from .financials_yfinance import build_income_annual_from_yfinance
+from .yfinance_tickers import get_ticker
 
 
 def _price_from_underlying(underlying):
@@ -36,6 +41,7 @@ def _price_from_underlying(underlying):
 
 _YF_RATE_LOCK = threading.Lock()
 _YF_NEXT_ALLOWED_TS = 0.0
+_RATE_LIMIT_RE = re.compile(r"rate limit|too many requests", re.IGNORECASE)
 
 
 def _get_float_env(name: str, default: float) -> float:
@@ -62,8 +68,7 @@ def _is_rate_limit_error(exc: Exception) -> bool:
     name = exc.__class__.__name__
     if name == "YFRateLimitError":
         return True
-    message = str(exc).lower()
-    return "rate limit" in message or "too many requests" in message
+    return _RATE_LIMIT_RE.search(str(exc)) is not None
 
 
 def _apply_rate_limit_cooldown():
@@ -142,27 +147,151 @@ def _options_with_retry(ticker_obj) -> list:
     return list(options or [])
 
 
+def _option_chains_concurrently(ticker_obj, expirations: list, max_workers: int = None) -> list:
+    """
+    Fetch option chains for several expirations in parallel (order preserved).
+    Requests still pass through the shared throttle; the pool overlaps their latency.
+    Returns (expiration, chain) pairs. An expiration that still fails after its
+    retries is skipped with a warning; if every expiration fails, the last error
+    is raised.
+    """
+    if not expirations:
+        return []
+    if max_workers is None:
+        max_workers = _get_int_env("YF_OPTION_MAX_WORKERS", 8)
+    max_workers = max(1, min(max_workers, len(expirations)))
+
+    def _fetch(exp_date):
+        try:
+            return _option_chain_with_retry(ticker_obj, exp_date), None
+        except Exception as exc:
+            return None, exc
+
+    if max_workers == 1:
+        results = [_fetch(exp_date) for exp_date in expirations]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_fetch, expirations))
+
+    pairs = []
+    last_exc = None
+    for exp_date, (chain, exc) in zip(expirations, results):
+        if exc is not None:
+            last_exc = exc
+            warnings.warn(
+                f"Skipping option chain {exp_date}: {exc}", RuntimeWarning, stacklevel=2
+            )
+            continue
+        pairs.append((exp_date, chain))
+    if not pairs and last_exc is not None:
+        raise last_exc
+    return pairs
+
+
 def _history_with_throttle(ticker_obj, period: str):
     _throttle_yfinance()
     return ticker_obj.history(period=period)
 
 
-def fetch_stock_data(
-    symbols,
-    period="4mo",
-    interval="1d",
-    require_ohlc: bool = True,
-    threads: bool = True,
-):
-    if isinstance(symbols, str):
-        symbols = [symbols]
+# yfinance's column set is fixed, so the rename maps are built once here;
+# rename() ignores keys a frame does not have. The close mapping depends on
+# which close column holds data, hence one prebuilt map per source.
+_YF_RENAME = {
+    "Date": "date",
+    "Datetime": "date",
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Volume": "volume",
+}
+_YF_RENAME_BY_CLOSE = {
+    source: {**_YF_RENAME, source: "close"} for source in ("Adj Close", "Close")
+}
+
+
+_PRICE_COLUMNS = ("open", "high", "low", "close")
+_NUMERIC_COLUMNS = frozenset(_PRICE_COLUMNS + ("volume",))
+
+
+def _cast_price_columns(df: pd.DataFrame) -> None:
+    """
+    Give every price column a float64 dtype in one astype, coercing any
+    object column (None/strings from yfinance) first. float64 is kept rather
+    than float32: TA-Lib only accepts doubles and prices are served as-is.
+    """
+    casts = {
+        col: np.float64
+        for col in _PRICE_COLUMNS
+        if col in df.columns and df[col].dtype != np.float64
+    }
+    if not casts:
+        return
+    for col in casts:
+        if df[col].dtype.kind == "O":
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    df[list(casts)] = df[list(casts)].astype(casts)
 
-    upper_symbols = [sym.upper() for sym in symbols]
-    threads = threads and len(upper_symbols) > 1
 
+def _mask_non_finite(df: pd.DataFrame) -> None:
+    """
+    Replace None/inf with NaN in place; float columns share one isfinite sweep.
+    Object price/volume columns (None from yfinance) are coerced to numbers
+    first so they join the sweep instead of going through replace().
+    """
+    float_cols = []
+    for col in df.columns:
+        if col == "date":
+            continue
+        kind = df[col].dtype.kind
+        if kind == "O" and col in _NUMERIC_COLUMNS:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+            kind = df[col].dtype.kind
+        if kind == "f":
+            float_cols.append(col)
+        elif kind == "O":
+            df[col] = df[col].replace({None: np.nan, np.inf: np.nan, -np.inf: np.nan})
+    if not float_cols:
+        return
+    values = df[float_cols].to_numpy()
+    bad = ~np.isfinite(values)
+    if bad.any():
+        values = values.copy()
+        values[bad] = np.nan
+        df[float_cols] = values
+
+
+def _clean_download_block(raw_data: pd.DataFrame):
+    """
+    Normalize a multi-ticker download in one pass over the shared block.
+    Every ticker shares the same index, so it is parsed/sorted once, and
+    non-finite floats are masked across all tickers with a single isfinite.
+    Returns (frame, masked); masked is False when object columns remain and
+    per-ticker cleanup is still needed. The input frame is never modified.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(raw_data.index):
+        raw_data = raw_data.set_axis(pd.to_datetime(raw_data.index, format="ISO8601"), axis=0)
+    if not raw_data.index.is_monotonic_increasing:
+        raw_data = raw_data.sort_index()
+
+    kinds = raw_data.dtypes.map(lambda dtype: dtype.kind)
+    if (kinds == "O").any():
+        return raw_data, False
+    float_cols = raw_data.columns[(kinds == "f").to_numpy()]
+    if len(float_cols):
+        values = raw_data[float_cols].to_numpy()
+        bad = ~np.isfinite(values)
+        if bad.any():
+            values = values.copy()
+            values[bad] = np.nan
+            raw_data = raw_data.copy()
+            raw_data[float_cols] = values
+    return raw_data, True
+
+
+def _download_chunk(chunk: list, period: str, interval: str, threads: bool):
     try:
-        raw_data = yf.download(
-            tickers=" ".join(upper_symbols),
+        return yf.download(
+            tickers=" ".join(chunk),
             period=period,
             interval=interval,
             group_by="ticker",
@@ -172,50 +301,160 @@ def fetch_stock_data(
             timeout=10,
         )
     except Exception:
-        raw_data = pd.DataFrame()
+        return pd.DataFrame()
+
+
+def _frames_by_symbol(chunk: list, raw_data) -> dict:
+    if isinstance(raw_data, dict):
+        return raw_data
+    if not isinstance(raw_data, pd.DataFrame) or raw_data.empty:
+        return {}
+    if isinstance(raw_data.columns, pd.MultiIndex):
+        present = set(raw_data.columns.get_level_values(0))
+        return {sym: raw_data[sym] for sym in chunk if sym in present}
+    if len(chunk) == 1:
+        return {chunk[0]: raw_data}
+    return {}
+
+
+def _download_ohlcv(upper_symbols: list, period: str, interval: str, threads: bool):
+    """
+    Download OHLCV bars, splitting long symbol lists into chunks.
+    Lists up to YF_DOWNLOAD_CHUNK_SIZE (20) go out as one yf.download call and
+    the raw result is returned. Longer lists are downloaded chunk by chunk
+    (concurrently when threads is set, with yfinance's own threading off) and
+    returned as {symbol: frame}.
+    """
+    chunk_size = max(1, _get_int_env("YF_DOWNLOAD_CHUNK_SIZE", 20))
+    if len(upper_symbols) <= chunk_size:
+        return _download_chunk(upper_symbols, period, interval, threads)
+
+    chunks = [upper_symbols[i:i + chunk_size] for i in range(0, len(upper_symbols), chunk_size)]
+
+    def _fetch(chunk):
+        return _frames_by_symbol(chunk, _download_chunk(chunk, period, interval, False))
+
+    if threads:
+        max_workers = max(1, min(_get_int_env("YF_DOWNLOAD_MAX_WORKERS", 8), len(chunks)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_fetch, chunks))
+    else:
+        results = [_fetch(chunk) for chunk in chunks]
+
+    frames = {}
+    for result in results:
+        frames.update(result)
+    return frames
+
+
+def fetch_stock_data(
+    symbols,
+    period="4mo",
+    interval="1d",
+    require_ohlc: bool = True,
+    threads: bool = True,
+):
+    """
+    Fetch cleaned OHLCV frames keyed by the requested symbols.
+    With OHLC_CACHE_DIR set, symbols whose stored history still covers the
+    period only download the last few days and are merged with the store;
+    the rest are downloaded in full. Results are written back to the store.
+    Stored files younger than OHLC_CACHE_MAX_AGE_SECONDS are served as-is.
+    """
+    if isinstance(symbols, str):
+        symbols = [symbols]
+    if not ohlc_store.is_enabled() or ohlc_store.period_offset(period) is None:
+        return _download_stock_frames(symbols, period, interval, require_ohlc, threads)
+
+    unique = list(dict.fromkeys(sym.upper() for sym in symbols))
+    stored = {}
+    extendable = {}
+    for sym in unique:
+        cached = ohlc_store.load(sym, interval, require_ohlc)
+        if not ohlc_store.can_extend(cached, period):
+            continue
+        if ohlc_store.is_fresh(sym, interval, require_ohlc):
+            stored[sym] = ohlc_store.trim(cached, period)
+        else:
+            extendable[sym] = cached
+
+    frames = {}
+    if extendable:
+        deltas = _download_stock_frames(
+            list(extendable), ohlc_store.DELTA_PERIOD, interval, require_ohlc, threads
+        )
+        for sym, cached in extendable.items():
+            merged = ohlc_store.merge(cached, deltas.get(sym))
+            if merged is not None:
+                # The whole history is saved; the caller gets its period.
+                ohlc_store.save(sym, interval, require_ohlc, merged)
+                stored[sym] = ohlc_store.trim(merged, period)
+
+    missing = [sym for sym in unique if sym not in stored]
+    if missing:
+        frames = _download_stock_frames(missing, period, interval, require_ohlc, threads)
+        for sym, frame in frames.items():
+            ohlc_store.save(sym, interval, require_ohlc, frame)
+    # Fresh files are not rewritten, so their age keeps counting.
+    frames.update(stored)
+    return _frames_by_spelling(frames, symbols)
+
+
+def _frames_by_spelling(frames, symbols):
+    # Callers add indicator columns in place, so a symbol requested under
+    # several spellings gets its own copy for every spelling after the first.
+    result = {}
+    seen = set()
+    for sym in symbols:
+        frame = frames.get(sym.upper(), pd.DataFrame())
+        result[sym] = frame.copy() if sym.upper() in seen else frame
+        seen.add(sym.upper())
+    return result
+
+
+def _download_stock_frames(symbols, period, interval, require_ohlc: bool, threads: bool):
+    # Repeated symbols are downloaded and cleaned once; later spellings in
+    # the input get copies of that frame.
+    upper_symbols = list(dict.fromkeys(sym.upper() for sym in symbols))
+    threads = threads and len(upper_symbols) > 1
+
+    raw_data = _download_ohlcv(upper_symbols, period, interval, threads)
     if len(upper_symbols) == 1 and isinstance(raw_data, pd.DataFrame) and raw_data.empty:
-        ticker = yf.Ticker(upper_symbols[0])
+        ticker = get_ticker(upper_symbols[0])
         raw_data = ticker.history(
             period=period,
             interval=interval,
             auto_adjust=False,
         )
 
-    data_dict = {}
+    frames = {}
     is_single_frame = (
         isinstance(raw_data, pd.DataFrame)
         and not isinstance(raw_data.columns, pd.MultiIndex)
         and len(upper_symbols) == 1
     )
+    is_block = isinstance(raw_data, pd.DataFrame) and isinstance(raw_data.columns, pd.MultiIndex)
+    block_cleaned = False
+    if is_block and not raw_data.empty:
+        raw_data, block_cleaned = _clean_download_block(raw_data)
 
-    for original_sym, upper_sym in zip(symbols, upper_symbols):
+    for upper_sym in upper_symbols:
         try:
-            if isinstance(raw_data, dict):
-                ticker_df = raw_data[upper_sym].copy()
-            elif is_single_frame:
-                ticker_df = raw_data.copy()
+            if is_single_frame:
+                ticker_df = raw_data
+            elif is_block:
+                # xs takes the ticker's column group directly off the block.
+                ticker_df = raw_data.xs(upper_sym, axis=1, level=0)
             else:
-                ticker_df = raw_data[upper_sym].copy()
+                ticker_df = raw_data[upper_sym]
         except KeyError:
-            data_dict[original_sym] = pd.DataFrame()
+            frames[upper_sym] = pd.DataFrame()
             continue
 
-        ticker_df.reset_index(inplace=True)
+        # reset_index returns a new frame, so the in-place steps below never
+        # touch raw_data and no defensive copy is needed.
+        ticker_df = ticker_df.reset_index()
 
-        if "Date" in ticker_df.columns:
-            date_col = "Date"
-        elif "Datetime" in ticker_df.columns:
-            date_col = "Datetime"
-        else:
-            date_col = ticker_df.columns[0]
-
-        rename_dict = {
-            date_col: "date",
-            "Open": "open",
-            "High": "high",
-            "Low": "low",
-            "Volume": "volume",
-        }
         close_source = None
         if "Adj Close" in ticker_df.columns:
             adj_close = ticker_df["Adj Close"]
@@ -227,30 +466,29 @@ def fetch_stock_data(
                 close_source = "Close"
             elif close_col.notna().sum() > ticker_df[close_source].notna().sum():
                 close_source = "Close"
-        if close_source:
-            rename_dict[close_source] = "close"
-
-        ticker_df.rename(columns=rename_dict, inplace=True)
-        ticker_df["date"] = pd.to_datetime(ticker_df["date"])
-        ticker_df.sort_values("date", inplace=True)
-        ticker_df.reset_index(drop=True, inplace=True)
-
-        ticker_df.replace({None: np.nan, np.inf: np.nan, -np.inf: np.nan}, inplace=True)
-        if "close" in ticker_df.columns:
-            ticker_df["close"] = pd.to_numeric(ticker_df["close"], errors="coerce")
+        ticker_df.rename(columns=_YF_RENAME_BY_CLOSE.get(close_source, _YF_RENAME), inplace=True)
+        if "date" not in ticker_df.columns:
+            ticker_df.rename(columns={ticker_df.columns[0]: "date"}, inplace=True)
+        if not pd.api.types.is_datetime64_any_dtype(ticker_df["date"]):
+            ticker_df["date"] = pd.to_datetime(ticker_df["date"], format="ISO8601")
+        # yfinance already returns ascending bars; only re-sort when it did not.
+        if not ticker_df["date"].is_monotonic_increasing:
+            ticker_df.sort_values("date", inplace=True, ignore_index=True)
+
+        if not block_cleaned:
+            _mask_non_finite(ticker_df)
+        _cast_price_columns(ticker_df)
         if require_ohlc:
-            required_cols = [col for col in ("open", "high", "low", "close") if col in ticker_df.columns]
+            required_cols = [col for col in _PRICE_COLUMNS if col in ticker_df.columns]
         else:
             required_cols = ["close"] if "close" in ticker_df.columns else []
-        if required_cols:
-            ticker_df.dropna(axis=0, how="any", subset=required_cols, inplace=True)
-        else:
-            ticker_df.dropna(axis=0, how="any", inplace=True)
-        ticker_df.reset_index(drop=True, inplace=True)
+        ticker_df.dropna(
+            axis=0, how="any", subset=required_cols or None, inplace=True, ignore_index=True
+        )
 
-        data_dict[original_sym] = ticker_df
+        frames[upper_sym] = ticker_df
 
-    return data_dict
+    return _frames_by_spelling(frames, symbols)
 
 
 def fetch_stock_option_data(
@@ -258,16 +496,19 @@ def fetch_stock_option_data(
     expiration: str = None,
     all_expirations: bool = False,
     option_type: str = None,
+    max_workers: int = None,
 ):
     """
     Fetch option chains plus the latest stock price.
+    max_workers caps concurrent chain requests for all_expirations
+    (default: YF_OPTION_MAX_WORKERS, 8).
 
     Pseudocode:
     1) Load ticker history to estimate latest price.
     2) If expiration is provided, fetch that chain.
     3) Otherwise fetch all expirations or the first available chain.
     """
-    ticker_obj = yf.Ticker(ticker)
+    ticker_obj = get_ticker(ticker)
     latest_price = None
 
     if expiration:
@@ -292,8 +533,8 @@ def fetch_stock_option_data(
     if all_expirations:
         expirations = _options_with_retry(ticker_obj)
         all_data = {}
-        for exp_date in expirations:
-            chain = _option_chain_with_retry(ticker_obj, exp_date)
+        chains = _option_chains_concurrently(ticker_obj, expirations, max_workers=max_workers)
+        for exp_date, chain in chains:
             if latest_price is None:
                 latest_price = _price_from_underlying(getattr(chain, "underlying", None))
             calls_df = chain.calls
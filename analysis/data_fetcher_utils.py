@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 import pandas as pd
 
@@ -15,6 +17,18 @@ from .financials_helpers import (
 from .financials_yfinance import normalize_line_name as _normalize_line_name_impl
 
 
+def parse_non_negative_int_env(env_key: str, default: int) -> int:
+    """Read a non-negative int setting; unset or unparsable values give default."""
+    raw = os.environ.get(env_key)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        return default
+    return max(value, 0)
+
+
 def normalize_symbol(symbol: str) -> str:
     return symbol.strip().upper() if symbol else ""
 
@@ -49,7 +63,7 @@ def safe_float(value):
                 return None
             value = cleaned.replace(",", "")
         value = float(value)
-    except (TypeError, ValueError):
+    except (TypeError, ValueError, OverflowError):
         return None
     if not np.isfinite(value):
         return None
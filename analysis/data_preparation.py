@@ -10,6 +10,18 @@ import pandas as pd
 from .data_fetcher import fetch_stock_data
 from .indicators import compute_bollinger_bands, compute_rsi
 
+
+def _with_indicators(df, include_rsi: bool):
+    """Attach Bollinger Bands (and optional RSI) to one symbol's frame."""
+    if df is None or df.empty or "close" not in df.columns:
+        return df
+
+    df = compute_bollinger_bands(df)
+    if include_rsi:
+        df = compute_rsi(df)
+    return df
+
+
 def prepare_stock_data(
     symbols,
     include_rsi: bool = True,
@@ -22,13 +34,7 @@ def prepare_stock_data(
     data_dict = fetch_stock_data(symbols, period=period, interval=interval)
 
     for symbol, df in data_dict.items():
-        if df is None or df.empty or "close" not in df.columns:
-            data_dict[symbol] = df
-            continue
-        df = compute_bollinger_bands(df)
-        if include_rsi:
-            df = compute_rsi(df)
-        data_dict[symbol] = df
+        data_dict[symbol] = _with_indicators(df, include_rsi)
 
     return data_dict
 
@@ -6,13 +6,18 @@ Pseudocode:
 2) For historical mode, scan all rows and record touch events.
 3) Group consecutive touches into hug events.
 """
+import numpy as np
 import pandas as pd
 
+_ALERT_FIELDS = ("close", "BB_upper", "BB_lower", "high", "low")
 
 def _list_tail(series: pd.Series, n: int = 30) -> list:
     """Return the last N values as floats/None (no NaNs)."""
+    values = series.to_numpy()[-n:]
+    if values.dtype.kind == "f":
+        return np.where(np.isnan(values), None, values.astype(np.float64)).tolist()
     out = []
-    for value in series.tail(n).tolist():
+    for value in values.tolist():
         if value is None or value != value:  # NaN != NaN
             out.append(None)
             continue
@@ -28,6 +33,34 @@ def _has_required_fields(row: pd.Series, fields: list[str]) -> bool:
     return all((row.get(field) is not None) and (row.get(field) == row.get(field)) for field in fields)
 
 
+def _last_values(data: dict, symbols: list[str], field: str) -> np.ndarray:
+    """Gather the last-row value of `field` for each symbol (NaN when missing)."""
+    def _last(df: pd.DataFrame) -> float:
+        if field not in df.columns:
+            return np.nan
+        value = df[field].iat[-1]
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    return np.fromiter((_last(data[s]) for s in symbols), dtype=np.float64, count=len(symbols))
+
+
+def build_scan_snapshot(data: dict) -> dict:
+    """
+    Collapse {symbol: DataFrame} into a struct-of-arrays view of the last row.
+
+    Returns {"symbols": [...], "close": ndarray, "BB_upper": ndarray, ...}
+    with one float64 entry per non-empty symbol (NaN when a field is missing).
+    """
+    symbols = [symbol for symbol, df in data.items() if df is not None and not df.empty]
+    snapshot = {"symbols": symbols}
+    for field in _ALERT_FIELDS:
+        snapshot[field] = _last_values(data, symbols, field)
+    return snapshot
+
+
 def _touch_sequence_value(touch: dict) -> int:
     """Return touch sequence id, preferring trading-session sequence over raw row index."""
     session_index = touch.get("session_index")
@@ -49,33 +82,29 @@ def process_bollinger_touches(data, mode: str = "alert") -> list[dict]:
     results: list[dict] = []
 
     if mode == "alert":
-        for symbol, df in data.items():
-            if df is None or df.empty:
-                continue
-            last_row = df.iloc[-1]
-            required = ["close", "BB_upper", "BB_lower", "high", "low"]
-            if not _has_required_fields(last_row, required):
-                continue
-
-            touched_side = None
-            if last_row["high"] >= last_row["BB_upper"]:
-                touched_side = "Upper"
-            elif last_row["low"] <= last_row["BB_lower"]:
-                touched_side = "Lower"
-
-            if touched_side:
-                results.append({
-                    "symbol": symbol,
-                    "close_price": float(last_row["close"]),
-                    "bb_upper": float(last_row["BB_upper"]),
-                    "bb_lower": float(last_row["BB_lower"]),
-                    "low_price": float(last_row["low"]),
-                    "high_price": float(last_row["high"]),
-                    "touched_side": touched_side,
-                    "recent_closes": _list_tail(df["close"]),
-                    "recent_bb_upper": _list_tail(df["BB_upper"]),
-                    "recent_bb_lower": _list_tail(df["BB_lower"]),
-                })
+        snapshot = build_scan_snapshot(data)
+        symbols = snapshot["symbols"]
+        if not symbols:
+            return results
+        valid = ~np.logical_or.reduce([np.isnan(snapshot[field]) for field in _ALERT_FIELDS])
+        upper_hit = valid & (snapshot["high"] >= snapshot["BB_upper"])
+        lower_hit = valid & ~upper_hit & (snapshot["low"] <= snapshot["BB_lower"])
+
+        for i in np.flatnonzero(upper_hit | lower_hit):
+            symbol = symbols[i]
+            df = data[symbol]
+            results.append({
+                "symbol": symbol,
+                "close_price": float(snapshot["close"][i]),
+                "bb_upper": float(snapshot["BB_upper"][i]),
+                "bb_lower": float(snapshot["BB_lower"][i]),
+                "low_price": float(snapshot["low"][i]),
+                "high_price": float(snapshot["high"][i]),
+                "touched_side": "Upper" if upper_hit[i] else "Lower",
+                "recent_closes": _list_tail(df["close"]),
+                "recent_bb_upper": _list_tail(df["BB_upper"]),
+                "recent_bb_lower": _list_tail(df["BB_lower"]),
+            })
         return results
 
     if mode == "historical":
@@ -1,38 +1,40 @@
+import math
 from collections import defaultdict
+from itertools import groupby
 from decimal import Decimal, InvalidOperation
 
+_NON_NUMERIC_KEYS = {"fiscalDateEnding", "reportedCurrency"}
+# Indexed by month number; slot 0 is unused.
+_MONTH_QUARTERS = (None, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4)
+
 
 def compute_partial_year_reports(quarterly_reports):
     if not quarterly_reports:
         return []
 
-    reports_with_dates = [
-        rpt for rpt in quarterly_reports if rpt.get("fiscalDateEnding")
-    ]
-    if not reports_with_dates:
-        return []
-
-    latest_report = max(reports_with_dates, key=lambda r: r["fiscalDateEnding"])
-    latest_date = latest_report.get("fiscalDateEnding", "")
-    if len(latest_date) < 7:
-        return []
-
-    latest_year = latest_date[:4]
-    latest_month = latest_date[5:7]
-    latest_quarter = month_to_quarter(latest_month)
-    if latest_quarter is None or latest_quarter == 0:
-        return []
-
+    # One pass finds the latest fiscal date and buckets reports by year/quarter.
+    latest_date = ""
     reports_by_year = defaultdict(dict)
     for report in quarterly_reports:
         date_str = report.get("fiscalDateEnding")
-        if not date_str or len(date_str) < 7:
+        if not date_str:
+            continue
+        if date_str > latest_date:
+            latest_date = date_str
+        if len(date_str) < 7:
             continue
-        year = date_str[:4]
         quarter = month_to_quarter(date_str[5:7])
         if quarter is None:
             continue
-        reports_by_year[year][quarter] = report
+        reports_by_year[date_str[:4]][quarter] = report
+
+    if len(latest_date) < 7:
+        return []
+
+    latest_year = latest_date[:4]
+    latest_quarter = month_to_quarter(latest_date[5:7])
+    if latest_quarter is None or latest_quarter == 0:
+        return []
 
     years_to_build = [str(int(latest_year) - offset) for offset in range(3)]
     partial_sets = []
@@ -68,44 +70,46 @@ def compute_annual_from_quarters(quarterly_reports):
     if not quarterly_reports:
         return []
 
-    reports_by_year = defaultdict(list)
-    for report in quarterly_reports:
-        date_str = report.get("fiscalDateEnding")
-        if not date_str or len(date_str) < 7:
-            continue
-        year = date_str[:4]
-        reports_by_year[year].append(report)
+    # One sort over every dated report puts each fiscal year in a contiguous,
+    # already-ordered run, so no per-year sort or max() is needed.
+    dated = sorted(
+        (report for report in quarterly_reports if len(report.get("fiscalDateEnding") or "") >= 7),
+        key=lambda r: r["fiscalDateEnding"],
+    )
 
     annual_reports = []
-    for year, reports in reports_by_year.items():
-        reports_sorted = sorted(reports, key=lambda r: r.get("fiscalDateEnding", ""))
-        if len(reports_sorted) < 4:
+    for _year, year_reports in groupby(dated, key=lambda r: r["fiscalDateEnding"][:4]):
+        year_reports = list(year_reports)
+        if len(year_reports) < 4:
             continue
-        last_four = reports_sorted[-4:]
+        last_four = year_reports[-4:]
         aggregated = aggregate_quarter_reports(last_four)
-        last_date = max(r.get("fiscalDateEnding", "") for r in last_four)
-        aggregated["fiscalDateEnding"] = last_date
+        aggregated["fiscalDateEnding"] = last_four[-1]["fiscalDateEnding"]
         annual_reports.append(aggregated)
 
-    return sorted(annual_reports, key=lambda r: r.get("fiscalDateEnding", ""), reverse=True)
+    annual_reports.reverse()
+    return annual_reports
 
 
 def aggregate_quarter_reports(reports):
-    totals = {}
+    values_by_key = defaultdict(list)
     currency = None
 
     for report in reports:
         if not currency:
             currency = report.get("reportedCurrency")
         for key, value in report.items():
-            if key in {"fiscalDateEnding", "reportedCurrency"}:
+            if key in _NON_NUMERIC_KEYS:
                 continue
             numeric_value = safe_decimal(value)
             if numeric_value is None:
                 continue
-            totals[key] = totals.get(key, Decimal("0")) + numeric_value
+            values_by_key[key].append(numeric_value)
 
-    aggregated = {key: decimal_to_string(val) for key, val in totals.items()}
+    aggregated = {
+        key: decimal_to_string(sum(values, Decimal("0")))
+        for key, values in values_by_key.items()
+    }
     if currency:
         aggregated["reportedCurrency"] = currency
     return aggregated
@@ -116,21 +120,23 @@ def month_to_quarter(month_str):
         month = int(month_str)
     except (TypeError, ValueError):
         return None
-    if 1 <= month <= 3:
-        return 1
-    if 4 <= month <= 6:
-        return 2
-    if 7 <= month <= 9:
-        return 3
-    if 10 <= month <= 12:
-        return 4
+    if 1 <= month <= 12:
+        return _MONTH_QUARTERS[month]
     return None
 
 
 def safe_decimal(value):
-    if value in (None, "", "None"):
+    if value is None or value == "" or value == "None":
         return Decimal("0")
+    value_type = type(value)
     try:
+        if value_type is str or value_type is int:
+            return Decimal(value)
+        if value_type is float:
+            if not math.isfinite(value):
+                return None
+            # repr() is the shortest round-trip form, matching Decimal(str(value)).
+            return Decimal(repr(value))
         return Decimal(str(value))
     except (InvalidOperation, TypeError, ValueError):
         return None
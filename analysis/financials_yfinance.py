@@ -1,15 +1,25 @@
+import re
 from datetime import date, datetime
+from functools import lru_cache
 
 import pandas as pd
-import yfinance as yf
 
 from .financials_helpers import safe_decimal, decimal_to_string
+from .yfinance_tickers import get_ticker
+
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
 
 
 def normalize_line_name(name) -> str:
     if name is None:
         return ""
-    return "".join(ch for ch in str(name).lower() if ch.isalnum())
+    return _normalize_line_text(str(name))
+
+
+@lru_cache(maxsize=512)
+def _normalize_line_text(text: str) -> str:
+    # Statement row labels repeat across every fiscal column, so cache them.
+    return _NON_ALNUM_RE.sub("", text.lower())
 
 
 _YF_INCOME_MAP = {
@@ -78,7 +88,7 @@ def _quarter_label_from_dates(most_recent, last_fiscal):
 
 def get_fiscal_quarter_info(symbol: str) -> dict:
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = get_ticker(symbol)
     except Exception:
         return {}
 
@@ -115,7 +125,7 @@ def get_fiscal_quarter_info(symbol: str) -> dict:
 
 def build_income_annual_from_yfinance(symbol: str) -> list:
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = get_ticker(symbol)
         financials = ticker.financials
     except Exception:
         return []
@@ -123,18 +133,27 @@ def build_income_annual_from_yfinance(symbol: str) -> list:
     if financials is None or getattr(financials, "empty", True):
         return []
 
+    # Row labels are shared by every fiscal column: resolve them to report
+    # keys once, then read the matching cells straight from the 2-D array.
+    row_keys = []
+    for pos, idx in enumerate(financials.index):
+        key = _YF_INCOME_MAP.get(normalize_line_name(idx))
+        if key:
+            row_keys.append((pos, key))
+    if not row_keys:
+        return []
+    values = financials.to_numpy()
+
     reports = []
-    for col in financials.columns:
+    for col_pos, col in enumerate(financials.columns):
         if hasattr(col, "strftime"):
             fiscal_date = col.strftime("%Y-%m-%d")
         else:
             fiscal_date = str(col)
 
         report = {"fiscalDateEnding": fiscal_date}
-        for idx, value in financials[col].items():
-            key = _YF_INCOME_MAP.get(normalize_line_name(idx))
-            if not key:
-                continue
+        for row_pos, key in row_keys:
+            value = values[row_pos, col_pos]
             if value is None or pd.isna(value):
                 continue
             numeric_value = safe_decimal(value)
@@ -5,7 +5,7 @@ Pseudocode:
 1) Fetch fundamentals safely (return {} on failure).
 2) Fetch peers and peer fundamentals for comparison.
 """
-from .data_fetcher import fetch_stock_fundamentals, fetch_peers
+from .data_fetcher import fetch_stock_fundamentals, fetch_stock_fundamentals_bulk, fetch_peers
 from .data_fetcher_fundamentals_extract import is_empty_fundamentals
 from .data_fetcher_fundamentals_loader import load_fundamentals
 from .data_fetcher_utils import normalize_symbol, symbol_candidates
@@ -33,15 +33,9 @@ def get_peers(symbol: str) -> list:
     return fetch_peers(symbol)
 
 def get_peers_fundamentals(peers: list) -> dict:
-    """Fetch fundamentals for each peer symbol."""
-    peers_fundamentals = {}
-    for peer_symbol in peers:
-        try:
-            f = fetch_stock_fundamentals(peer_symbol)
-            peers_fundamentals[peer_symbol] = f
-        except Exception:
-            peers_fundamentals[peer_symbol] = {}
-    return peers_fundamentals
+    """Fetch fundamentals for each peer symbol (concurrently)."""
+    fetched = fetch_stock_fundamentals_bulk(peers)
+    return {peer_symbol: fetched.get(peer_symbol, {}) for peer_symbol in peers}
 
 def compute_peer_metric_avg(peers_fundamentals: dict, metric: str):
     vals = []
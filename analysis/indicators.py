@@ -15,14 +15,19 @@ def compute_bollinger_bands(
     nbdevup: int = 2,
     nbdevdn: int = 2,
 ) -> pd.DataFrame:
-    """Add Bollinger Bands columns to a price DataFrame."""
+    """
+    Add Bollinger Bands columns to a price DataFrame.
+    Band columns are stored as plain float64 (NaN for gaps) so downstream
+    .to_numpy() calls get an unboxed buffer rather than object/nullable data.
+    """
+    close = pd.to_numeric(data['close'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
     upper, mid, lower = talib.BBANDS(
-        data['close'].astype(float),
+        close,
         timeperiod=timeperiod, nbdevup=nbdevup, nbdevdn=nbdevdn, matype=0
     )
-    data['BB_upper'] = upper
-    data['BB_middle'] = mid
-    data['BB_lower'] = lower
+    data['BB_upper'] = np.asarray(upper, dtype=np.float64)
+    data['BB_middle'] = np.asarray(mid, dtype=np.float64)
+    data['BB_lower'] = np.asarray(lower, dtype=np.float64)
     return data
 
 def compute_rsi(data: pd.DataFrame, timeperiod: int = 6) -> pd.DataFrame:
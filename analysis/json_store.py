@@ -0,0 +1,73 @@
+"""
+json_store.py
+Purpose: persist small JSON payloads (fundamentals, peer lists) so they
+survive restarts and are shared between worker processes.
+Pseudocode:
+1) Enabled only when JSON_CACHE_DIR is set; one file per (namespace, key)
+   under that directory, named by a hash of the key.
+2) Each file holds {"ts": write time, "value": payload}.
+3) load() misses when the file is absent, unreadable, or older than the
+   caller's ttl, and reports the remaining lifetime on hits.
+4) Writes go through a temp file and os.replace so readers never see a
+   partial file.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+
+def cache_dir():
+    raw = os.getenv("JSON_CACHE_DIR")
+    return Path(raw) if raw else None
+
+
+def is_enabled() -> bool:
+    return cache_dir() is not None
+
+
+def _path(namespace: str, key: str) -> Path:
+    digest = hashlib.md5(f"{namespace}:{key}".encode("utf-8")).hexdigest()
+    return cache_dir() / namespace / f"{digest}.json"
+
+
+def load(namespace: str, key: str, ttl_seconds: float):
+    """Return (value, remaining_seconds) for a live entry, else None."""
+    if not is_enabled() or ttl_seconds <= 0:
+        return None
+    try:
+        with open(_path(namespace, key), "rb") as handle:
+            entry = json.load(handle)
+        remaining = float(entry["ts"]) + ttl_seconds - time.time()
+        value = entry["value"]
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    if remaining <= 0:
+        return None
+    return value, remaining
+
+
+def save(namespace: str, key: str, value) -> None:
+    if not is_enabled() or not value:
+        return
+    path = _path(namespace, key)
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer, so threads of one process saving
+        # the same key never write into each other's file before the rename.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=f"{path.name}.",
+            suffix=".tmp", delete=False,
+        ) as handle:
+            tmp_path = Path(handle.name)
+            json.dump({"ts": time.time(), "value": value}, handle)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,176 @@
+"""
+ohlc_store.py
+Purpose: persist cleaned OHLCV frames per symbol so repeat fetches only
+download the newest bars.
+Pseudocode:
+1) Enabled only when OHLC_CACHE_DIR is set; one file per
+   (symbol, interval, require_ohlc) under that directory.
+2) Frames are written as Parquet when a Parquet engine is installed,
+   otherwise as pickle; both are pandas-native.
+3) A cached frame is reusable when it reaches back to the requested
+   period's start and its last bar is recent enough for a short delta
+   download to overlap it. Files are not trimmed to a period, so one file
+   serves every period it covers.
+4) Merging checks the overlapping bars before the stored last bar (that
+   one may be a partial session the delta replaces); a changed close (e.g.
+   Adj Close rewritten after a dividend) rejects the cache so the caller
+   refetches the full period.
+5) With OHLC_CACHE_MAX_AGE_SECONDS set, a file written within that window
+   is served as-is without even the delta download.
+"""
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    _PARQUET_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency guard
+    try:
+        import fastparquet  # noqa: F401
+        _PARQUET_AVAILABLE = True
+    except Exception:
+        _PARQUET_AVAILABLE = False
+
+DELTA_PERIOD = "5d"
+# Weekends/holidays: a "4mo" history may start a few days after the cutoff.
+_COVERAGE_SLACK = pd.Timedelta(days=7)
+# The delta download must still overlap the cached tail.
+_MAX_DELTA_GAP = pd.Timedelta(days=4)
+_PERIOD_UNITS = {"d": "days", "wk": "weeks", "mo": "months", "y": "years"}
+
+
+def cache_dir():
+    raw = os.getenv("OHLC_CACHE_DIR")
+    return Path(raw) if raw else None
+
+
+def is_enabled() -> bool:
+    return cache_dir() is not None
+
+
+def max_age_seconds() -> float:
+    raw = os.getenv("OHLC_CACHE_MAX_AGE_SECONDS")
+    if not raw:
+        return 0.0
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return 0.0
+
+
+def period_offset(period: str):
+    """Map a yfinance period string ("5d", "4mo", "1y") to a DateOffset; None if unsupported."""
+    if not isinstance(period, str):
+        return None
+    for suffix, unit in _PERIOD_UNITS.items():
+        if period.endswith(suffix) and period[: -len(suffix)].isdigit():
+            return pd.DateOffset(**{unit: int(period[: -len(suffix)])})
+    return None
+
+
+def _path(symbol: str, interval: str, require_ohlc: bool) -> Path:
+    suffix = ".parquet" if _PARQUET_AVAILABLE else ".pkl"
+    kind = "ohlc" if require_ohlc else "close"
+    return cache_dir() / f"interval={interval}" / kind / f"{symbol}{suffix}"
+
+
+def load(symbol: str, interval: str, require_ohlc: bool):
+    path = _path(symbol, interval, require_ohlc)
+    if not path.exists():
+        return None
+    try:
+        if _PARQUET_AVAILABLE:
+            return pd.read_parquet(path)
+        return pd.read_pickle(path)
+    except Exception:
+        return None
+
+
+def save(symbol: str, interval: str, require_ohlc: bool, df: pd.DataFrame) -> None:
+    if df is None or df.empty:
+        return
+    path = _path(symbol, interval, require_ohlc)
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer, so concurrent saves of one symbol
+        # never write into each other's file before the rename.
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+        ) as handle:
+            tmp_path = Path(handle.name)
+            if _PARQUET_AVAILABLE:
+                df.to_parquet(handle, compression="snappy", index=False)
+            else:
+                df.to_pickle(handle)
+        os.replace(tmp_path, path)
+    except Exception:
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
+def is_fresh(symbol: str, interval: str, require_ohlc: bool) -> bool:
+    """True when the stored file was written within OHLC_CACHE_MAX_AGE_SECONDS."""
+    max_age = max_age_seconds()
+    if max_age <= 0:
+        return False
+    try:
+        modified = _path(symbol, interval, require_ohlc).stat().st_mtime
+    except OSError:
+        return False
+    return time.time() - modified < max_age
+
+
+def _now_like(dates: pd.Series) -> pd.Timestamp:
+    return pd.Timestamp.now(tz=getattr(dates.dt, "tz", None))
+
+
+def can_extend(cached, period: str) -> bool:
+    """True when cached covers the period start and a delta download will overlap its tail."""
+    offset = period_offset(period)
+    if offset is None or cached is None or cached.empty or "date" not in cached.columns:
+        return False
+    dates = cached["date"]
+    now = _now_like(dates)
+    return dates.iloc[0] <= now - offset + _COVERAGE_SLACK and dates.iloc[-1] >= now - _MAX_DELTA_GAP
+
+
+def merge(cached: pd.DataFrame, delta: pd.DataFrame):
+    """
+    Append delta bars to cached, replacing the bars from the delta's start on.
+    Returns None when the delta does not reach back to the stored last bar,
+    or when completed bars they share disagree on close.
+    """
+    if delta is None or delta.empty or "close" not in delta.columns:
+        return None
+    last_date = cached["date"].iloc[-1]
+    if delta["date"].iloc[0] > last_date:
+        return None
+    # The stored last bar may have been a live, partial bar; its close is
+    # expected to move and the delta's copy replaces it.
+    completed = cached[cached["date"] < last_date]
+    overlap = completed.merge(delta[["date", "close"]], on="date", suffixes=("", "_new"))
+    if not overlap.empty and not np.allclose(
+        overlap["close"].to_numpy(dtype=np.float64),
+        overlap["close_new"].to_numpy(dtype=np.float64),
+        rtol=1e-6,
+        equal_nan=True,
+    ):
+        return None
+
+    start = delta["date"].iloc[0]
+    return pd.concat([cached[cached["date"] < start], delta], ignore_index=True)
+
+
+def trim(df: pd.DataFrame, period: str) -> pd.DataFrame:
+    """Drop bars older than the period window."""
+    cutoff = _now_like(df["date"]) - period_offset(period)
+    return df[df["date"] >= cutoff].reset_index(drop=True)
@@ -0,0 +1,55 @@
+"""
+ttl_cache.py
+Purpose: small thread-safe in-process cache with per-entry expiry.
+Pseudocode:
+1) Store key -> (expires_at, value) in an OrderedDict under a lock.
+2) get() drops and misses expired entries, and refreshes recency on hits.
+3) set() takes an optional per-entry ttl and evicts the least recently
+   used entry once max_size is exceeded; discard() drops one key.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float, max_size: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None) -> None:
+        ttl = self.ttl_seconds if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,29 @@
+"""
+yfinance_tickers.py
+Purpose: share yf.Ticker objects between fetchers for a short window.
+Pseudocode:
+1) Bucket wall-clock time into TTL windows.
+2) Memoize yf.Ticker per (symbol, window) so repeat lookups reuse the
+   object (and the crumb/cookie state and per-object caches it holds).
+3) A new window builds a fresh Ticker; LRU eviction drops the old ones.
+"""
+import time
+from functools import lru_cache
+
+import yfinance as yf
+
+_TICKER_TTL_SECONDS = 300
+
+
+@lru_cache(maxsize=256)
+def _ticker_cached(symbol: str, bucket: int):
+    return yf.Ticker(symbol)
+
+
+def get_ticker(symbol: str):
+    """Return a yf.Ticker for symbol, reused for up to _TICKER_TTL_SECONDS."""
+    return _ticker_cached(symbol, int(time.time() // _TICKER_TTL_SECONDS))
+
+
+def clear_ticker_cache() -> None:
+    _ticker_cached.cache_clear()
@@ -10,6 +10,15 @@ def _normalize_symbol(symbol: str) -> str:
     return symbol.strip().upper() if symbol else ""
 
 
+def _decode_payload(payload):
+    if isinstance(payload, str):
+        try:
+            return json.loads(payload)
+        except Exception:
+            return None
+    return payload
+
+
 def get_financial_statement(symbol: str, statement_type: str):
     symbol = _normalize_symbol(symbol)
     if not symbol:
@@ -34,13 +43,40 @@ def get_financial_statement(symbol: str, statement_type: str):
             row = cur.fetchone()
             if not row:
                 return None
-            payload = row[0]
-            if isinstance(payload, str):
-                try:
-                    payload = json.loads(payload)
-                except Exception:
-                    payload = None
-            return payload
+            return _decode_payload(row[0])
+    finally:
+        conn.close()
+
+
+def get_financial_statements(symbol: str, statement_types) -> dict:
+    """Read several statements for one symbol in a single query; missing ones are omitted."""
+    symbol = _normalize_symbol(symbol)
+    statement_types = list(dict.fromkeys(statement_types or ()))
+    if not symbol or not statement_types:
+        return {}
+    for statement_type in statement_types:
+        if statement_type not in STATEMENT_TYPES:
+            raise ValueError(f"Invalid statement type: {statement_type}")
+
+    conn = get_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT fs.statement_type, fs.data
+                FROM financial_statements fs
+                JOIN tickers t ON fs.ticker_id = t.id
+                WHERE t.symbol = %s
+                  AND fs.statement_type = ANY(%s);
+                """,
+                (symbol, statement_types),
+            )
+            payloads = {}
+            for statement_type, data in cur.fetchall():
+                payload = _decode_payload(data)
+                if payload is not None:
+                    payloads[statement_type] = payload
+            return payloads
     finally:
         conn.close()
 
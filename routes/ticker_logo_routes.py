@@ -2,6 +2,7 @@
 
 import base64
 import requests
+from requests.adapters import HTTPAdapter
 from flask import Blueprint, request, jsonify
 from dotenv import load_dotenv
 import os
@@ -14,6 +15,12 @@ from database.ticker_repository import (
 load_dotenv()
 FINNHUB_API_KEY = os.getenv("finnhub_api_key")
 
+# Shared keep-alive session: the profile lookup and the logo download reuse
+# pooled TLS connections instead of a fresh handshake per request.
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+_HTTP_TIMEOUT_SECONDS = 10
+
 ticker_logo_blueprint = Blueprint("ticker_logo_blueprint", __name__)
 
 @ticker_logo_blueprint.route("/api/tickers/<symbol>/logo", methods=["GET"])
@@ -32,7 +39,7 @@ def get_ticker_logo(symbol):
     # If it's None, fetch from Finnhub
     finnhub_url = f"https://finnhub.io/api/v1/stock/profile2?symbol={symbol}&token={FINNHUB_API_KEY}"
     try:
-        resp = requests.get(finnhub_url)
+        resp = _HTTP.get(finnhub_url, timeout=_HTTP_TIMEOUT_SECONDS)
         resp.raise_for_status()
         data = resp.json()
         logo_url = data.get("logo")
@@ -42,7 +49,7 @@ def get_ticker_logo(symbol):
             return jsonify({"symbol": symbol, "logo_base64": None}), 404
 
         # Fetch the image
-        img_resp = requests.get(logo_url)
+        img_resp = _HTTP.get(logo_url, timeout=_HTTP_TIMEOUT_SECONDS)
         img_resp.raise_for_status()
 
         # Convert to Base64
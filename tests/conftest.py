@@ -15,6 +15,11 @@ from database.connection import get_connection
 from database.create_user_table import create_users_table
 from database.create_ticker_table import create_tickers_table
 from database.create_lists_table import create_lists_and_list_tickers_tables
+from analysis.daily_scan import _clear_scan_tickers_cache
+from analysis.data_fetcher_financials import _clear_financials_cache
+from analysis.data_fetcher_fundamentals import _clear_fundamentals_cache
+from analysis.data_fetcher_fundamentals_loader import _clear_info_cache
+from analysis.yfinance_tickers import clear_ticker_cache
 
 # Load environment variables from .env (if exists)
 load_dotenv()
@@ -87,3 +92,25 @@ def client(app):
     """
     with app.test_client() as client:
         yield client
+
+
+def _clear_process_caches():
+    clear_ticker_cache()
+    _clear_financials_cache()
+    _clear_fundamentals_cache()
+    _clear_info_cache()
+    _clear_scan_tickers_cache()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_process_caches(monkeypatch):
+    """
+    Drop memoized tickers, statements, fundamentals, peers and the scan
+    ticker list, and disable the on-disk caches unless a test opts in, so
+    each test sees only its own patched fetchers.
+    """
+    monkeypatch.delenv("JSON_CACHE_DIR", raising=False)
+    monkeypatch.delenv("OHLC_CACHE_DIR", raising=False)
+    _clear_process_caches()
+    yield
+    _clear_process_caches()
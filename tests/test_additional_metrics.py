@@ -53,3 +53,20 @@ def test_compute_avg_hug_length():
 
     # Test empty list
     assert compute_avg_hug_length([]) == 0.0
+
+
+def test_compute_additional_metrics_does_not_mutate_input():
+    data = pd.DataFrame({
+        'volume': [100, 200],
+        'high': [10.0, 12.0],
+        'low': [5.0, 7.0],
+        'close': [6.0, 11.0],
+        'BB_upper': [10.0, 12.0],
+        'BB_lower': [5.0, 7.0],
+        'rsi': [30.0, 40.0],
+    })
+    before = data.copy()
+
+    compute_additional_metrics(data, 6.0, 11.0)
+
+    pd.testing.assert_frame_equal(data, before)
@@ -21,3 +21,74 @@ def test_build_chart_data_handles_non_contiguous_index():
     assert chart[1]["isTouch"] is True
     assert chart[0]["date"] == "2024-01-02"
     assert chart[2]["close"] == 102.0
+
+
+def test_build_chart_data_maps_nan_bands_to_none():
+    df = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+            "close": [100.0, 101.0],
+            "BB_upper": [float("nan"), 106.0],
+            "BB_lower": [None, 96.0],
+        }
+    )
+
+    chart = build_chart_data(df, [])
+
+    assert chart[0]["upper"] is None
+    assert chart[0]["lower"] is None
+    assert chart[1]["upper"] == 106.0
+    assert chart[1]["lower"] == 96.0
+    assert not any(point["isTouch"] for point in chart)
+
+
+def test_build_chart_data_accepts_string_dates():
+    df = pd.DataFrame(
+        {
+            "date": ["2024-01-02", "2024-01-03"],
+            "close": [100.0, 101.0],
+            "BB_upper": [105.0, 106.0],
+            "BB_lower": [95.0, 96.0],
+        }
+    )
+
+    chart = build_chart_data(df, [])
+
+    assert [point["date"] for point in chart] == ["2024-01-02", "2024-01-03"]
+
+
+def test_build_chart_columns_round_trips_to_rows():
+    from analysis.chart_builder import build_chart_columns, to_row_dicts
+
+    df = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+            "close": [100.0, 101.0],
+            "BB_upper": [float("nan"), 106.0],
+            "BB_lower": [95.0, 96.0],
+        }
+    )
+
+    columns = build_chart_columns(df, [{"index": 0}])
+
+    assert columns == {
+        "date": ["2024-01-02", "2024-01-03"],
+        "close": [100.0, 101.0],
+        "upper": [None, 106.0],
+        "lower": [95.0, 96.0],
+        "isTouch": [True, False],
+    }
+    assert to_row_dicts(columns) == build_chart_data(df, [{"index": 0}])
+
+
+def test_build_chart_data_ignores_out_of_range_touch_indices():
+    df = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]),
+            "close": [100.0, 101.5, 102.0],
+        }
+    )
+
+    chart = build_chart_data(df, [{"index": -1}, {"index": 3}, {"index": 99}, {"index": 0}])
+
+    assert [point["isTouch"] for point in chart] == [True, False, False]
@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+from analysis import daily_scan as daily_scan_module
+
+
+def test_daily_scan_reuses_ticker_list_within_ttl_bucket():
+    daily_scan_module._tickers_cached.cache_clear()
+    with (
+        patch("analysis.daily_scan.get_all_tickers", return_value=["AAPL", "MSFT"]) as mock_tickers,
+        patch("analysis.daily_scan.prepare_stock_data", return_value={}) as mock_prepare,
+        patch("analysis.daily_scan.time.time", return_value=1_000.0),
+    ):
+        first = daily_scan_module.daily_scan()
+        second = daily_scan_module.daily_scan()
+
+    assert mock_tickers.call_count == 1
+    mock_prepare.assert_called_with(["AAPL", "MSFT"])
+    assert first["alerts"] == [] and second["alerts"] == []
+
+    with (
+        patch("analysis.daily_scan.get_all_tickers", return_value=["NVDA"]) as mock_tickers,
+        patch("analysis.daily_scan.prepare_stock_data", return_value={}) as mock_prepare,
+        patch("analysis.daily_scan.time.time", return_value=1_000.0 + daily_scan_module._TICKERS_TTL_SECONDS),
+    ):
+        daily_scan_module.daily_scan()
+
+    assert mock_tickers.call_count == 1
+    mock_prepare.assert_called_with(["NVDA"])
+    daily_scan_module._tickers_cached.cache_clear()
@@ -33,7 +33,7 @@ def test_fetch_peers_success(mock_peers):
     mock_peers.assert_called_once_with("MSFT")
 
 
-@patch("analysis.data_fetcher_fundamentals.yf.Ticker")
+@patch("analysis.data_fetcher_fundamentals.get_ticker")
 def test_fetch_stock_fundamentals_computes_ratios(mock_ticker):
     ticker = Mock()
     ticker.get_info.return_value = {
@@ -53,7 +53,7 @@ def test_fetch_stock_fundamentals_computes_ratios(mock_ticker):
     assert result["PGI"] == pytest.approx((200.0 / 6.0) / 40.0)
 
 
-@patch("analysis.data_fetcher_fundamentals.yf.Ticker")
+@patch("analysis.data_fetcher_fundamentals.get_ticker")
 def test_fetch_stock_fundamentals_peg_fallback(mock_ticker):
     ticker = Mock()
     ticker.get_info.return_value = {
@@ -68,7 +68,7 @@ def test_fetch_stock_fundamentals_peg_fallback(mock_ticker):
     assert result["PEG"] == pytest.approx(1.3)
 
 
-@patch("analysis.data_fetcher_fundamentals.yf.Ticker")
+@patch("analysis.data_fetcher_fundamentals.get_ticker")
 def test_fetch_stock_fundamentals_pgi_from_eps(mock_ticker):
     ticker = Mock()
     ticker.get_info.return_value = {
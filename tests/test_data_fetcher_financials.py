@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 import analysis.data_fetcher_financials as financials
+import analysis.ttl_cache as ttl_cache
 
 
 FIXTURE_DIR = Path(__file__).with_name("fixtures") / "data_fetcher"
@@ -17,6 +18,10 @@ class _FakeResponse:
         self._payload = payload
         self.status_code = status_code
 
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
+
     def json(self):
         return self._payload
 
@@ -27,7 +32,7 @@ def _load_fixture(name):
 
 def test_fetch_financials_requires_api_key(monkeypatch):
     monkeypatch.setattr(financials, "alpha_vantage_api_key", None)
-    monkeypatch.setattr(financials, "get_financial_statement", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(financials, "get_financial_statements", lambda *_args, **_kwargs: {})
     with pytest.raises(ValueError):
         financials.fetch_financials("AAPL")
 
@@ -38,8 +43,8 @@ def test_fetch_financials_uses_db_when_available(monkeypatch):
     monkeypatch.setattr(financials, "alpha_vantage_api_key", None)
     monkeypatch.setattr(
         financials,
-        "get_financial_statement",
-        lambda *_args, **_kwargs: db_payload,
+        "get_financial_statements",
+        lambda _symbol, statements: {statement: db_payload for statement in statements},
     )
     result = financials.fetch_financials("AAPL", statements="income_statement")
     assert result["income_statement"]["quarterlyReports"] == db_payload["quarterlyReports"]
@@ -48,9 +53,9 @@ def test_fetch_financials_uses_db_when_available(monkeypatch):
 def test_fetch_financials_sorts_truncates_and_computes(monkeypatch):
     payload = _load_fixture("alpha_vantage_income_statement.json")
     monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
-    monkeypatch.setattr(financials, "get_financial_statement", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(financials, "get_financial_statements", lambda *_args, **_kwargs: {})
     monkeypatch.setattr(
-        financials.requests, "get", lambda _url, timeout=8: _FakeResponse(payload)
+        financials._AV_SESSION, "get", lambda _url, params=None, timeout=8: _FakeResponse(payload)
     )
 
     result = financials.fetch_financials("aapl", statements="income_statement")
@@ -65,8 +70,8 @@ def test_fetch_financials_sorts_truncates_and_computes(monkeypatch):
 def test_fetch_financials_alpha_error_raises(monkeypatch):
     payload = {"Error Message": "bad call"}
     monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
-    monkeypatch.setattr(financials, "get_financial_statement", lambda *_args, **_kwargs: None)
-    monkeypatch.setattr(financials.requests, "get", lambda _url, timeout=8: _FakeResponse(payload))
+    monkeypatch.setattr(financials, "get_financial_statements", lambda *_args, **_kwargs: {})
+    monkeypatch.setattr(financials._AV_SESSION, "get", lambda _url, params=None, timeout=8: _FakeResponse(payload))
     with pytest.raises(ValueError):
         financials.fetch_financials("AAPL", statements="income_statement")
 
@@ -78,11 +83,11 @@ def test_fetch_financials_refreshes_when_stale(monkeypatch):
     monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
     monkeypatch.setattr(
         financials,
-        "get_financial_statement",
-        lambda *_args, **_kwargs: db_payload,
+        "get_financial_statements",
+        lambda _symbol, statements: {statement: db_payload for statement in statements},
     )
     monkeypatch.setattr(
-        financials.requests, "get", lambda _url, timeout=8: _FakeResponse(payload)
+        financials._AV_SESSION, "get", lambda _url, params=None, timeout=8: _FakeResponse(payload)
     )
     captured = {}
 
@@ -116,9 +121,9 @@ def test_fetch_financials_attaches_quarter_info(monkeypatch):
         "mostRecentQuarterLabel": "Q2",
     }
     monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
-    monkeypatch.setattr(financials, "get_financial_statement", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(financials, "get_financial_statements", lambda *_args, **_kwargs: {})
     monkeypatch.setattr(
-        financials.requests, "get", lambda _url, timeout=8: _FakeResponse(payload)
+        financials._AV_SESSION, "get", lambda _url, params=None, timeout=8: _FakeResponse(payload)
     )
     monkeypatch.setattr(financials, "get_fiscal_quarter_info", lambda _symbol: quarter_info)
 
@@ -128,3 +133,331 @@ def test_fetch_financials_attaches_quarter_info(monkeypatch):
     assert data["mostRecentQuarter"] == "2025-11-30"
     assert data["lastFiscalYearEnd"] == "2025-05-31"
     assert data["mostRecentQuarterLabel"] == "Q2"
+
+
+def test_fetch_financials_fetches_multiple_statements_concurrently(monkeypatch):
+    payloads = {
+        "INCOME_STATEMENT": _load_fixture("alpha_vantage_income_statement.json"),
+        "BALANCE_SHEET": _load_fixture("alpha_vantage_balance_sheet.json"),
+        "CASH_FLOW": _load_fixture("alpha_vantage_cash_flow.json"),
+    }
+    requested = []
+
+    def _fake_get(url, params=None, timeout=8):
+        assert url == financials._AV_URL
+        assert params["symbol"] == "AAPL"
+        function_name = params["function"]
+        requested.append(function_name)
+        return _FakeResponse(json.loads(json.dumps(payloads[function_name])))
+
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
+    monkeypatch.setattr(financials, "get_financial_statements", lambda *_args, **_kwargs: {})
+    monkeypatch.setattr(financials, "upsert_financial_statement", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(financials, "get_fiscal_quarter_info", lambda _symbol: {})
+    monkeypatch.setattr(financials._AV_SESSION, "get", _fake_get)
+
+    result = financials.fetch_financials("AAPL")
+
+    assert list(result) == ["income_statement", "balance_sheet", "cash_flow"]
+    assert sorted(requested) == sorted(payloads)
+    assert all(result[key]["symbol"] == "AAPL" for key in result)
+
+
+def test_fetch_financials_serves_repeat_calls_from_cache(monkeypatch):
+    payload = _load_fixture("alpha_vantage_income_statement.json")
+    calls = []
+
+    def _fake_get(url, params=None, timeout=8):
+        calls.append(url)
+        return _FakeResponse(json.loads(json.dumps(payload)))
+
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
+    monkeypatch.setattr(financials, "get_financial_statements", lambda *_args, **_kwargs: {})
+    monkeypatch.setattr(financials, "upsert_financial_statement", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(financials, "get_fiscal_quarter_info", lambda _symbol: {})
+    monkeypatch.setattr(financials._AV_SESSION, "get", _fake_get)
+
+    first = financials.fetch_financials("AAPL", statements="income_statement")
+    first["income_statement"]["symbol"] = "MUTATED"
+    second = financials.fetch_financials("aapl", statements=["income_statement"])
+
+    assert len(calls) == 1
+    assert second["income_statement"]["symbol"] == "AAPL"
+    assert (
+        second["income_statement"]["quarterlyReports"]
+        is first["income_statement"]["quarterlyReports"]
+    )
+
+
+def test_fetch_financials_bypass_cache_refetches(monkeypatch):
+    calls = []
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", None)
+
+    def _fake_db(_symbol, statements):
+        calls.append(1)
+        return {statement: {"annualReports": [{"fiscalDateEnding": "2023-12-31"}]} for statement in statements}
+
+    monkeypatch.setattr(financials, "get_financial_statements", _fake_db)
+    monkeypatch.setattr(financials, "get_fiscal_quarter_info", lambda _symbol: {})
+
+    financials.fetch_financials("AAPL", statements="balance_sheet")
+    financials.fetch_financials("AAPL", statements="balance_sheet", bypass_cache=True)
+    financials.fetch_financials("AAPL", statements="balance_sheet")
+
+    assert len(calls) == 2
+
+
+def test_fetch_financials_reads_db_statements_in_one_call(monkeypatch):
+    calls = []
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", None)
+    monkeypatch.setattr(financials, "get_fiscal_quarter_info", lambda _symbol: {})
+
+    def _fake_db(symbol, statements):
+        calls.append((symbol, list(statements)))
+        return {statement: {"annualReports": [{"fiscalDateEnding": "2023-12-31"}]} for statement in statements}
+
+    monkeypatch.setattr(financials, "get_financial_statements", _fake_db)
+
+    result = financials.fetch_financials("AAPL", statements=["balance_sheet", "cash_flow"])
+
+    assert calls == [("AAPL", ["balance_sheet", "cash_flow"])]
+    assert result["balance_sheet"]["symbol"] == "AAPL"
+    assert result["cash_flow"]["symbol"] == "AAPL"
+
+
+def test_fetch_financials_cache_can_be_disabled(monkeypatch):
+    calls = []
+    monkeypatch.setenv("financials_cache_ttl_seconds", "0")
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", None)
+
+    def _fake_db(_symbol, statements):
+        calls.append(1)
+        return {statement: {"annualReports": [{"fiscalDateEnding": "2023-12-31"}]} for statement in statements}
+
+    monkeypatch.setattr(financials, "get_financial_statements", _fake_db)
+
+    financials.fetch_financials("AAPL", statements="income_statement")
+    financials.fetch_financials("AAPL", statements="income_statement")
+
+    assert len(calls) == 2
+
+
+def test_fetch_financials_expires_empty_statements_sooner(monkeypatch):
+    clock = {"now": 1_000.0}
+    calls = []
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
+    monkeypatch.setattr(financials, "get_financial_statements", lambda *_args, **_kwargs: {})
+    monkeypatch.setattr(financials, "get_fiscal_quarter_info", lambda _symbol: {})
+
+    def _fake_get(url, params=None, timeout=8):
+        calls.append(url)
+        return _FakeResponse({"symbol": "AAPL", "annualReports": [], "quarterlyReports": []})
+
+    monkeypatch.setattr(financials._AV_SESSION, "get", _fake_get)
+
+    financials.fetch_financials("AAPL", statements="income_statement")
+    financials.fetch_financials("AAPL", statements="income_statement")
+    assert len(calls) == 1
+
+    clock["now"] += financials._DEFAULT_EMPTY_CACHE_TTL_SECONDS
+    financials.fetch_financials("AAPL", statements="income_statement")
+    assert len(calls) == 2
+
+
+def test_alpha_vantage_requests_respect_concurrency_cap(monkeypatch):
+    import threading
+    import time as _time
+
+    payload = _load_fixture("alpha_vantage_income_statement.json")
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def _fake_get(url, params=None, timeout=8):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        _time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return _FakeResponse(json.loads(json.dumps(payload)))
+
+    monkeypatch.setattr(financials, "_AV_CONCURRENCY", threading.BoundedSemaphore(2))
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
+    monkeypatch.setattr(financials, "get_financial_statements", lambda *_args, **_kwargs: {})
+    monkeypatch.setattr(financials, "upsert_financial_statement", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(financials, "get_fiscal_quarter_info", lambda _symbol: {})
+    monkeypatch.setattr(financials._AV_SESSION, "get", _fake_get)
+
+    threads = [
+        threading.Thread(target=financials.fetch_financials, args=(sym,))
+        for sym in ("AAA", "BBB", "CCC")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert state["peak"] <= 2
+
+
+def test_alpha_vantage_payload_decoded_from_raw_bytes(monkeypatch):
+    class _FakeOrjson:
+        calls = 0
+
+        @classmethod
+        def loads(cls, raw):
+            cls.calls += 1
+            return json.loads(raw)
+
+    payload = _load_fixture("alpha_vantage_income_statement.json")
+    monkeypatch.setattr(financials, "orjson", _FakeOrjson)
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
+    monkeypatch.setattr(financials, "get_financial_statements", lambda *_args, **_kwargs: {})
+    monkeypatch.setattr(
+        financials._AV_SESSION, "get", lambda _url, params=None, timeout=8: _FakeResponse(payload)
+    )
+
+    result = financials.fetch_financials("aapl", statements="income_statement")
+    assert _FakeOrjson.calls == 1
+    assert result["income_statement"]["annualReports"][0]["fiscalDateEnding"] == "2023-12-31"
+
+
+def test_fetch_financials_skips_db_after_recent_miss(monkeypatch):
+    db_calls = []
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", None)
+    monkeypatch.setattr(
+        financials, "get_financial_statements", lambda *_args, **_kwargs: db_calls.append(1)
+    )
+    monkeypatch.setattr(financials, "get_fiscal_quarter_info", lambda _symbol: {})
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            financials.fetch_financials("AAPL", statements="income_statement")
+    assert len(db_calls) == 1
+
+    # With Alpha Vantage in play the DB is re-read: another worker may
+    # have written the row since the miss was cached.
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
+
+    def _rate_limited(_url, params=None, timeout=8):
+        return _FakeResponse({"Note": "Thank you for using Alpha Vantage!"})
+
+    monkeypatch.setattr(financials._AV_SESSION, "get", _rate_limited)
+    with pytest.raises(ValueError):
+        financials.fetch_financials("AAPL", statements="income_statement")
+    assert len(db_calls) == 2
+
+    payload = _load_fixture("alpha_vantage_income_statement.json")
+    monkeypatch.setattr(
+        financials._AV_SESSION, "get", lambda _url, params=None, timeout=8: _FakeResponse(payload)
+    )
+    monkeypatch.setattr(financials, "upsert_financial_statement", lambda *_args, **_kwargs: None)
+    financials.fetch_financials("AAPL", statements="income_statement")
+    assert financials._DB_MISS_CACHE.get(("AAPL", "income_statement")) is None
+
+
+def test_fetch_financials_skips_alpha_vantage_for_failing_symbol(monkeypatch):
+    calls = []
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
+    monkeypatch.setattr(financials, "get_financial_statements", lambda *_args, **_kwargs: {})
+    monkeypatch.setattr(financials, "get_fiscal_quarter_info", lambda _symbol: {})
+
+    def _invalid_symbol(_url, params=None, timeout=8):
+        calls.append(params["symbol"])
+        return _FakeResponse({"Error Message": "Invalid API call."})
+
+    monkeypatch.setattr(financials._AV_SESSION, "get", _invalid_symbol)
+    for _ in range(financials._AV_SYMBOL_FAIL_THRESHOLD):
+        with pytest.raises(ValueError):
+            financials.fetch_financials("BADX", statements="income_statement", bypass_cache=True)
+
+    with pytest.raises(ValueError, match="retrying later"):
+        financials.fetch_financials("BADX", statements="income_statement")
+    assert len(calls) == financials._AV_SYMBOL_FAIL_THRESHOLD
+    assert financials._FINANCIALS_CACHE.get(("BADX", "income_statement")) is None
+
+    # Rate-limit notes are not the symbol's fault.
+    monkeypatch.setattr(
+        financials._AV_SESSION,
+        "get",
+        lambda _url, params=None, timeout=8: _FakeResponse({"Note": "Thank you for using Alpha Vantage!"}),
+    )
+    for _ in range(financials._AV_SYMBOL_FAIL_THRESHOLD):
+        with pytest.raises(ValueError):
+            financials.fetch_financials("AAPL", statements="income_statement", bypass_cache=True)
+    assert not financials._av_symbol_blocked("AAPL")
+
+
+def test_fetch_financials_keeps_db_copy_until_a_newer_quarter_is_reported(monkeypatch):
+    db_payload = {"symbol": "AAPL", "quarterlyReports": [{"fiscalDateEnding": "2024-03-31"}]}
+    monkeypatch.setattr(financials, "_utc_today", lambda: datetime(2024, 7, 31).date())
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
+    monkeypatch.setattr(
+        financials,
+        "get_financial_statements",
+        lambda _symbol, statements: {statement: dict(db_payload) for statement in statements},
+    )
+
+    av_calls = []
+
+    def _rate_limited(_url, params=None, timeout=8):
+        av_calls.append(params["function"])
+        return _FakeResponse({"Note": "Thank you for using Alpha Vantage!"})
+
+    monkeypatch.setattr(financials._AV_SESSION, "get", _rate_limited)
+    monkeypatch.setattr(
+        financials, "get_fiscal_quarter_info", lambda _symbol: {"mostRecentQuarter": "2024-03-31"}
+    )
+    result = financials.fetch_financials("AAPL", statements="income_statement")
+    assert result["income_statement"]["quarterlyReports"] == db_payload["quarterlyReports"]
+    assert av_calls == []
+
+    # A newer reported quarter means Alpha Vantage may have it.
+    financials._clear_financials_cache()
+    monkeypatch.setattr(
+        financials, "get_fiscal_quarter_info", lambda _symbol: {"mostRecentQuarter": "2024-06-30"}
+    )
+    financials.fetch_financials("AAPL", statements="income_statement")
+    assert len(av_calls) == 1
+
+    # Twice the day cap is a hard bound either way.
+    financials._clear_financials_cache()
+    monkeypatch.setattr(financials, "_utc_today", lambda: datetime(2024, 10, 31).date())
+    monkeypatch.setattr(
+        financials, "get_fiscal_quarter_info", lambda _symbol: {"mostRecentQuarter": "2024-03-31"}
+    )
+    financials.fetch_financials("AAPL", statements="income_statement")
+    assert len(av_calls) == 2
+
+
+def test_failed_multi_statement_request_counts_once_for_breaker(monkeypatch):
+    monkeypatch.setattr(financials, "alpha_vantage_api_key", "test")
+    monkeypatch.setattr(financials, "get_financial_statements", lambda *_args, **_kwargs: {})
+    monkeypatch.setattr(financials, "get_fiscal_quarter_info", lambda _symbol: {})
+    monkeypatch.setattr(
+        financials._AV_SESSION,
+        "get",
+        lambda _url, params=None, timeout=8: _FakeResponse({"Error Message": "Invalid API call."}),
+    )
+
+    with pytest.raises(ValueError):
+        financials.fetch_financials("BADX")
+    count, _ = financials._AV_SYMBOL_FAILS.get("BADX")
+    assert count == 1
+
+
+def test_latest_report_date_skips_unparseable_dates():
+    from datetime import date
+
+    payload = {
+        "quarterlyReports": [
+            {"fiscalDateEnding": "2023-09-30"},
+            {"fiscalDateEnding": "2024-99-99"},
+            {"fiscalDateEnding": None},
+            {"fiscalDateEnding": "2023-12-31T00:00:00"},
+            "bad",
+        ]
+    }
+    assert financials._latest_report_date(payload, "quarterlyReports") == date(2023, 12, 31)
+    assert financials._latest_report_date({"quarterlyReports": []}, "quarterlyReports") is None
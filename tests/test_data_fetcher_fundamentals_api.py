@@ -8,12 +8,8 @@ import analysis.data_fetcher_fundamentals as fundamentals
 
 
 def test_fetch_stock_fundamentals_uses_alt_symbol(monkeypatch):
-    mock_load = Mock(
-        side_effect=[
-            {},
-            {"trailingPE": 12.0},
-        ]
-    )
+    payloads = {"BRK.B": {}, "BRK-B": {"trailingPE": 12.0}}
+    mock_load = Mock(side_effect=lambda candidate, include_alpha=True: payloads[candidate])
     mock_empty = Mock(side_effect=lambda payload: not payload)
     monkeypatch.setattr(fundamentals, "load_fundamentals", mock_load)
     monkeypatch.setattr(fundamentals, "is_empty_fundamentals", mock_empty)
@@ -24,6 +20,20 @@ def test_fetch_stock_fundamentals_uses_alt_symbol(monkeypatch):
     assert mock_load.call_args_list[1].args[0] == "BRK-B"
 
 
+def test_fetch_stock_fundamentals_skips_alternates_when_primary_hits(monkeypatch):
+    calls = []
+
+    def _load(candidate, include_alpha=True):
+        calls.append(candidate)
+        return {"trailingPE": 10.0}
+
+    monkeypatch.setattr(fundamentals, "load_fundamentals", _load)
+    monkeypatch.setattr(fundamentals, "is_empty_fundamentals", lambda payload: not payload)
+
+    assert fundamentals.fetch_stock_fundamentals("brk.b") == {"trailingPE": 10.0}
+    assert calls == ["BRK.B"]
+
+
 def test_fetch_stock_fundamentals_returns_empty_when_missing(monkeypatch):
     mock_load = Mock(side_effect=[{}, {}])
     mock_empty = Mock(side_effect=lambda payload: not payload)
@@ -34,6 +44,43 @@ def test_fetch_stock_fundamentals_returns_empty_when_missing(monkeypatch):
     assert result == {}
 
 
+def test_load_fundamentals_short_circuits_without_info(monkeypatch):
+    monkeypatch.setattr(fundamentals, "get_ticker", lambda symbol: object())
+    monkeypatch.setattr(fundamentals, "get_ticker_info", lambda _t: {})
+    monkeypatch.setattr(fundamentals, "get_fast_info", lambda _t: {})
+    mock_history = Mock(return_value=100.0)
+    monkeypatch.setattr(fundamentals, "get_price_from_history", mock_history)
+
+    assert fundamentals.load_fundamentals("ZZZZ") == {}
+    mock_history.assert_not_called()
+
+
+def test_load_fundamentals_keeps_peg_field_meanings(monkeypatch):
+    info = {
+        "trailingPE": 20.0,
+        "forwardPE": 18.0,
+        "pegRatio": 1.5,
+        "trailingPegRatio": 2.5,
+        "dividendYield": 0.55,
+    }
+    monkeypatch.setattr(fundamentals, "get_ticker", lambda symbol: object())
+    monkeypatch.setattr(fundamentals, "get_ticker_info", lambda _t: dict(info))
+    monkeypatch.setattr(fundamentals, "get_fast_info", lambda _t: {})
+    monkeypatch.setattr(fundamentals, "get_price_from_history", lambda _t: None)
+
+    result = fundamentals.load_fundamentals("AAPL")
+    assert result["trailingPEG"] == 2.5
+    assert result["PEG"] == 2.5
+    assert result["dividendYield"] == 0.55
+
+    # pegRatio is Yahoo's forward 5-year PEG; it is never served as trailing PEG.
+    del info["trailingPegRatio"]
+    fundamentals._clear_fundamentals_cache()
+    result = fundamentals.load_fundamentals("AAPL")
+    assert result["trailingPEG"] is None
+    assert result["PEG"] is None
+
+
 def test_fetch_peers_handles_errors(monkeypatch):
     mock_client = Mock()
     mock_client.company_peers.side_effect = RuntimeError("boom")
@@ -43,3 +90,59 @@ def test_fetch_peers_handles_errors(monkeypatch):
     mock_client.company_peers.side_effect = None
     mock_client.company_peers.return_value = "bad"
     assert fundamentals.fetch_peers("AAPL") == []
+
+
+def test_fetch_stock_fundamentals_bulk_dedupes_and_isolates_failures(monkeypatch):
+    calls = []
+
+    def _fake_fetch(symbol, include_alpha=True):
+        calls.append(symbol)
+        if symbol == "BAD":
+            raise RuntimeError("boom")
+        return {"trailingPE": float(len(symbol))}
+
+    monkeypatch.setattr(fundamentals, "fetch_stock_fundamentals", _fake_fetch)
+
+    result = fundamentals.fetch_stock_fundamentals_bulk(["AAPL", "BAD", "AAPL", "MSFT", ""])
+
+    assert result == {"AAPL": {"trailingPE": 4.0}, "BAD": {}, "MSFT": {"trailingPE": 4.0}}
+    assert sorted(calls) == ["AAPL", "BAD", "MSFT"]
+
+
+def test_fetch_stock_fundamentals_and_peers_are_cached(monkeypatch):
+    mock_load = Mock(return_value={"trailingPE": 12.0})
+    monkeypatch.setattr(fundamentals, "load_fundamentals", mock_load)
+    mock_client = Mock()
+    mock_client.company_peers.return_value = ["MSFT", "GOOGL"]
+    monkeypatch.setattr(fundamentals, "finnhub_client", mock_client)
+
+    first = fundamentals.fetch_stock_fundamentals("aapl")
+    first["trailingPE"] = None
+    assert fundamentals.fetch_stock_fundamentals("AAPL") == {"trailingPE": 12.0}
+    assert mock_load.call_count == 1
+
+    peers = fundamentals.fetch_peers("AAPL")
+    peers.append("XYZ")
+    assert fundamentals.fetch_peers("aapl") == ["MSFT", "GOOGL"]
+    assert mock_client.company_peers.call_count == 1
+
+
+def test_fetch_stock_fundamentals_does_not_cache_empty(monkeypatch):
+    mock_load = Mock(return_value={})
+    monkeypatch.setattr(fundamentals, "load_fundamentals", mock_load)
+
+    fundamentals.fetch_stock_fundamentals("ZZZZ")
+    fundamentals.fetch_stock_fundamentals("ZZZZ")
+
+    assert mock_load.call_count == 2
+
+
+def test_fetch_peers_bypass_cache_refetches(monkeypatch):
+    mock_client = Mock()
+    mock_client.company_peers.side_effect = [["MSFT"], ["MSFT", "GOOGL"]]
+    monkeypatch.setattr(fundamentals, "finnhub_client", mock_client)
+
+    assert fundamentals.fetch_peers("AAPL") == ["MSFT"]
+    assert fundamentals.fetch_peers("AAPL", bypass_cache=True) == ["MSFT", "GOOGL"]
+    assert fundamentals.fetch_peers("AAPL") == ["MSFT", "GOOGL"]
+    assert mock_client.company_peers.call_count == 2
@@ -25,7 +25,7 @@ class _FakeTicker:
 
 def test_load_fundamentals_calls_extract_and_alpha(monkeypatch):
     fake_ticker = _FakeTicker()
-    monkeypatch.setattr(loader.yf, "Ticker", lambda symbol: fake_ticker)
+    monkeypatch.setattr(loader, "get_ticker", lambda symbol: fake_ticker)
     monkeypatch.setattr(loader, "get_ticker_info", lambda _t: {"trailingPE": 10.0})
     monkeypatch.setattr(loader, "get_fast_info", lambda _t: {"lastPrice": 100.0})
     monkeypatch.setattr(loader, "get_price_from_history", lambda _t: 123.0)
@@ -48,7 +48,7 @@ def test_load_fundamentals_calls_extract_and_alpha(monkeypatch):
 
 def test_load_fundamentals_skips_alpha_when_disabled(monkeypatch):
     fake_ticker = _FakeTicker()
-    monkeypatch.setattr(loader.yf, "Ticker", lambda symbol: fake_ticker)
+    monkeypatch.setattr(loader, "get_ticker", lambda symbol: fake_ticker)
     monkeypatch.setattr(loader, "get_ticker_info", lambda _t: {"trailingPE": 10.0})
     monkeypatch.setattr(loader, "get_fast_info", lambda _t: {"lastPrice": 100.0})
     monkeypatch.setattr(loader, "get_price_from_history", lambda _t: None)
@@ -68,14 +68,14 @@ def test_load_fundamentals_returns_empty_on_failure(monkeypatch):
     def _boom(*_args, **_kwargs):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(loader.yf, "Ticker", _boom)
+    monkeypatch.setattr(loader, "get_ticker", _boom)
     with pytest.raises(RuntimeError):
         loader.load_fundamentals("AAPL")
 
 
 def test_load_fundamentals_ignores_alpha_errors(monkeypatch):
     fake_ticker = _FakeTicker()
-    monkeypatch.setattr(loader.yf, "Ticker", lambda symbol: fake_ticker)
+    monkeypatch.setattr(loader, "get_ticker", lambda symbol: fake_ticker)
     monkeypatch.setattr(loader, "get_ticker_info", lambda _t: {"trailingPE": 10.0})
     monkeypatch.setattr(loader, "get_fast_info", lambda _t: {"lastPrice": 100.0})
     monkeypatch.setattr(loader, "get_price_from_history", lambda _t: None)
@@ -86,3 +86,25 @@ def test_load_fundamentals_ignores_alpha_errors(monkeypatch):
     monkeypatch.setattr(loader, "fetch_financials", _boom)
     result = loader.load_fundamentals("AAPL", include_alpha=True)
     assert result.get("trailingPE") == 10.0
+
+
+def test_load_fundamentals_caches_info_without_live_quote(monkeypatch):
+    fake_ticker = _FakeTicker()
+    mock_info = Mock(return_value={"trailingPE": 10.0, "currentPrice": 90.0})
+    prices = iter([123.0, 125.0])
+    monkeypatch.setattr(loader, "get_ticker", lambda symbol: fake_ticker)
+    monkeypatch.setattr(loader, "get_ticker_info", mock_info)
+    monkeypatch.setattr(loader, "get_fast_info", lambda _t: {})
+    monkeypatch.setattr(loader, "get_price_from_history", lambda _t: next(prices))
+    mock_extract = Mock(return_value={"ok": True})
+    monkeypatch.setattr(loader, "extract_fundamentals", mock_extract)
+
+    loader.load_fundamentals("AAPL", include_alpha=False)
+    loader.load_fundamentals("AAPL", include_alpha=False)
+
+    assert mock_info.call_count == 1
+    first_info = mock_extract.call_args_list[0].args[0]
+    second_info = mock_extract.call_args_list[1].args[0]
+    assert first_info["currentPrice"] == 90.0
+    assert second_info["currentPrice"] == 125.0
+    assert second_info["trailingPE"] == 10.0
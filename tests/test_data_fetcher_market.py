@@ -66,6 +66,19 @@ def test_fetch_stock_data_handles_datetime_and_drops_invalid(monkeypatch):
     assert out["date"].dtype.kind == "M"
 
 
+def test_fetch_stock_data_parses_iso_string_dates(monkeypatch):
+    df = pd.DataFrame(
+        {"Open": [1.0, 2.0], "High": [2.0, 3.0], "Low": [0.5, 1.5], "Close": [1.5, 2.5]},
+        index=pd.Index(["2024-01-03T00:00:00", "2024-01-02T00:00:00"], name="Date"),
+    )
+    monkeypatch.setattr(market.yf, "download", lambda **_kwargs: {"AAPL": df})
+
+    out = market.fetch_stock_data(["AAPL"])["AAPL"]
+
+    assert out["date"].tolist() == [pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-03")]
+    assert out["close"].tolist() == [2.5, 1.5]
+
+
 def test_fetch_stock_option_data_variants(monkeypatch):
     chain = SimpleNamespace(
         calls=pd.DataFrame({"contractSymbol": ["CALL1"], "strike": [100]}),
@@ -86,3 +99,291 @@ def test_fetch_stock_option_data_variants(monkeypatch):
 
     result_default = market.fetch_stock_option_data("AAPL")
     assert set(result_default["option_data"].keys()) == {"calls", "puts"}
+
+
+def test_fetch_stock_option_data_all_expirations_keeps_order(monkeypatch):
+    expirations = ["2024-10-18", "2024-10-25", "2024-11-01"]
+
+    class _PerExpirationTicker(_FakeTicker):
+        def option_chain(self, expiration):
+            return SimpleNamespace(
+                calls=pd.DataFrame({"contractSymbol": [f"C-{expiration}"]}),
+                puts=pd.DataFrame({"contractSymbol": [f"P-{expiration}"]}),
+                underlying={"regularMarketPrice": 50.0},
+            )
+
+    fake_ticker = _PerExpirationTicker(pd.DataFrame(), expirations, None, pd.DataFrame())
+    monkeypatch.setattr(market.yf, "Ticker", lambda symbol: fake_ticker)
+    monkeypatch.setenv("YF_RATE_LIMIT_SECONDS", "0")
+
+    result = market.fetch_stock_option_data("AAPL", all_expirations=True, option_type="puts")
+
+    assert list(result["option_data"]) == expirations
+    for exp in expirations:
+        assert result["option_data"][exp]["contractSymbol"].iloc[0] == f"P-{exp}"
+    assert result["stock_price"] == 50.0
+
+
+def test_fetch_stock_data_masks_infinite_and_none_values(monkeypatch):
+    idx = pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"])
+    df = pd.DataFrame(
+        {
+            "Open": [100.0, np.inf, 101.0],
+            "High": [105.0, 106.0, 107.0],
+            "Low": [99.0, 100.0, -np.inf],
+            "Close": pd.Series([104.0, 105.0, None], dtype=object).to_numpy(),
+            "Volume": [1000, 1100, 1200],
+        },
+        index=idx,
+    )
+    df.index.name = "Date"
+    monkeypatch.setattr(market.yf, "download", lambda **_kwargs: {"AAPL": df})
+
+    out = market.fetch_stock_data(["AAPL"])["AAPL"]
+
+    assert out["date"].tolist() == [pd.Timestamp("2024-01-02")]
+    assert out["close"].tolist() == [104.0]
+    assert out["volume"].dtype.kind == "i"
+
+
+def test_fetch_stock_data_masks_inf_in_object_price_columns(monkeypatch):
+    idx = pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"])
+    df = pd.DataFrame(
+        {
+            "Open": [100.0, 101.0, 102.0],
+            "High": [105.0, 106.0, 107.0],
+            "Low": [99.0, 100.0, 101.0],
+            "Close": pd.Series([104.0, np.inf, None], dtype=object).to_numpy(),
+            "Volume": pd.Series([1000, None, 1200], dtype=object).to_numpy(),
+        },
+        index=idx,
+    )
+    df.index.name = "Date"
+    monkeypatch.setattr(market.yf, "download", lambda **_kwargs: {"AAPL": df})
+
+    out = market.fetch_stock_data(["AAPL"])["AAPL"]
+
+    assert out["close"].dtype == np.float64
+    assert out["close"].tolist() == [104.0]
+    assert out["volume"].tolist() == [1000.0]
+
+
+def test_fetch_stock_data_leaves_downloaded_frame_untouched(monkeypatch):
+    idx = pd.to_datetime(["2024-01-03", "2024-01-02"])
+    df = pd.DataFrame(
+        {
+            "Open": [101.0, np.inf],
+            "High": [106.0, 105.0],
+            "Low": [100.0, 99.0],
+            "Close": [105.0, 104.0],
+            "Volume": [1100, 1000],
+        },
+        index=idx,
+    )
+    df.index.name = "Date"
+    original = df.copy()
+    monkeypatch.setattr(market.yf, "download", lambda **_kwargs: df)
+
+    out = market.fetch_stock_data("AAPL")["AAPL"]
+
+    assert out["close"].tolist() == [105.0]
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_build_income_annual_from_yfinance_skips_unmapped_and_missing(monkeypatch):
+    financials = pd.DataFrame(
+        {
+            pd.Timestamp("2023-12-31"): [1000.5, 7.0, np.nan],
+            pd.Timestamp("2022-12-31"): [np.nan, 8.0, np.nan],
+        },
+        index=["Total Revenue", "Tax Rate For Calcs", "Net Income"],
+    )
+    fake_ticker = _FakeTicker(financials, [], None, pd.DataFrame())
+    monkeypatch.setattr(market.yf, "Ticker", lambda symbol: fake_ticker)
+
+    reports = market._build_income_annual_from_yfinance("AAPL")
+
+    assert reports == [{"fiscalDateEnding": "2023-12-31", "totalRevenue": "1000.5"}]
+
+
+def test_fetch_stock_data_picks_close_source_per_ticker(monkeypatch):
+    idx = pd.to_datetime(["2024-01-02", "2024-01-03"])
+    base = {"Open": [1.0, 2.0], "High": [2.0, 3.0], "Low": [0.5, 1.5], "Volume": [10, 20]}
+    with_adj = pd.DataFrame({**base, "Close": [1.5, 2.5], "Adj Close": [1.4, 2.4]}, index=idx)
+    without_adj = pd.DataFrame(
+        {**base, "Close": [1.6, 2.6], "Adj Close": [np.nan, np.nan]}, index=idx
+    )
+    for frame in (with_adj, without_adj):
+        frame.index.name = "Date"
+    monkeypatch.setattr(
+        market.yf, "download", lambda **_kwargs: {"AAA": with_adj, "BBB": without_adj}
+    )
+
+    result = market.fetch_stock_data(["AAA", "BBB"])
+
+    assert result["AAA"]["close"].tolist() == [1.4, 2.4]
+    assert result["BBB"]["close"].tolist() == [1.6, 2.6]
+    assert "Close" in result["AAA"].columns
+    assert "Adj Close" in result["BBB"].columns
+
+
+def test_fetch_stock_option_data_all_expirations_skips_failed_chain(monkeypatch):
+    expirations = ["2024-10-18", "2024-10-25", "2024-11-01"]
+
+    class _FlakyTicker(_FakeTicker):
+        def option_chain(self, expiration):
+            if expiration == "2024-10-25":
+                raise RuntimeError("boom")
+            return SimpleNamespace(
+                calls=pd.DataFrame({"contractSymbol": [f"C-{expiration}"]}),
+                puts=pd.DataFrame({"contractSymbol": [f"P-{expiration}"]}),
+            )
+
+    history_df = pd.DataFrame({"Close": [10.0]})
+    fake_ticker = _FlakyTicker(pd.DataFrame(), expirations, None, history_df)
+    monkeypatch.setattr(market.yf, "Ticker", lambda symbol: fake_ticker)
+    monkeypatch.setenv("YF_RATE_LIMIT_SECONDS", "0")
+    monkeypatch.setenv("YF_OPTION_RETRIES", "0")
+
+    with pytest.warns(RuntimeWarning, match="2024-10-25"):
+        result = market.fetch_stock_option_data(
+            "AAPL", all_expirations=True, option_type="calls", max_workers=2
+        )
+
+    assert list(result["option_data"]) == ["2024-10-18", "2024-11-01"]
+
+    fake_ticker.options = ["2024-10-25"]
+    with pytest.raises(RuntimeError, match="boom"), pytest.warns(RuntimeWarning):
+        market.fetch_stock_option_data("AAPL", all_expirations=True)
+
+
+def test_fetch_stock_data_downloads_long_lists_in_chunks(monkeypatch):
+    symbols = [f"S{i:02d}" for i in range(45)]
+    idx = pd.to_datetime(["2024-01-02"])
+    calls = []
+
+    def _fake_download(**kwargs):
+        chunk = kwargs["tickers"].split()
+        calls.append((chunk, kwargs["threads"]))
+        frames = {
+            sym: pd.DataFrame(
+                {"Open": [1.0], "High": [2.0], "Low": [0.5], "Close": [1.5], "Volume": [10]},
+                index=idx,
+            )
+            for sym in chunk
+            if sym != "S44"
+        }
+        for frame in frames.values():
+            frame.index.name = "Date"
+        return pd.concat(frames, axis=1)
+
+    monkeypatch.setattr(market.yf, "download", _fake_download)
+
+    result = market.fetch_stock_data(symbols)
+
+    assert sorted(len(chunk) for chunk, _threads in calls) == [5, 20, 20]
+    assert all(threads is False for _chunk, threads in calls)
+    assert list(result) == symbols
+    assert result["S00"]["close"].tolist() == [1.5]
+    assert result["S44"].empty
+
+
+def test_fetch_stock_data_downloads_repeated_symbols_once(monkeypatch):
+    idx = pd.to_datetime(["2024-01-02"])
+    calls = []
+
+    def _fake_download(**kwargs):
+        chunk = kwargs["tickers"].split()
+        calls.append(chunk)
+        frames = {
+            sym: pd.DataFrame(
+                {"Open": [1.0], "High": [2.0], "Low": [0.5], "Close": [1.5], "Volume": [10]},
+                index=idx,
+            )
+            for sym in chunk
+        }
+        for frame in frames.values():
+            frame.index.name = "Date"
+        return pd.concat(frames, axis=1)
+
+    monkeypatch.setattr(market.yf, "download", _fake_download)
+
+    result = market.fetch_stock_data(["AAPL", "msft", "aapl", "MSFT"])
+
+    assert calls == [["AAPL", "MSFT"]]
+    assert list(result) == ["AAPL", "msft", "aapl", "MSFT"]
+    assert result["aapl"] is not result["AAPL"]
+    pd.testing.assert_frame_equal(result["aapl"], result["AAPL"])
+    assert result["msft"]["close"].tolist() == [1.5]
+
+
+def test_fetch_stock_data_cleans_multi_ticker_block_once(monkeypatch):
+    idx = pd.to_datetime(["2024-01-03", "2024-01-02", "2024-01-04"])
+    frames = {
+        "AAA": pd.DataFrame(
+            {
+                "Open": [2.0, 1.0, 3.0],
+                "High": [2.5, np.inf, 3.5],
+                "Low": [1.5, 0.5, 2.5],
+                "Close": [2.2, 1.2, 3.2],
+                "Volume": [20, 10, 30],
+            },
+            index=idx,
+        ),
+        "BBB": pd.DataFrame(
+            {
+                "Open": [5.0, 4.0, 6.0],
+                "High": [5.5, 4.5, 6.5],
+                "Low": [4.5, 3.5, 5.5],
+                "Close": [5.2, 4.2, -np.inf],
+                "Volume": [50, 40, 60],
+            },
+            index=idx,
+        ),
+    }
+    raw = pd.concat(frames, axis=1)
+    raw.index.name = "Date"
+    original = raw.copy()
+    monkeypatch.setattr(market.yf, "download", lambda **_kwargs: raw)
+
+    result = market.fetch_stock_data(["AAA", "BBB"])
+
+    assert result["AAA"]["date"].tolist() == [pd.Timestamp("2024-01-03"), pd.Timestamp("2024-01-04")]
+    assert result["AAA"]["close"].tolist() == [2.2, 3.2]
+    assert result["BBB"]["close"].tolist() == [4.2, 5.2]
+    assert result["BBB"]["volume"].dtype.kind == "i"
+    pd.testing.assert_frame_equal(raw, original)
+
+
+def test_fetch_stock_data_returns_float64_prices(monkeypatch):
+    idx = pd.to_datetime(["2024-01-02", "2024-01-03"])
+    df = pd.DataFrame(
+        {
+            "Open": pd.Series(["100.5", None], dtype=object).to_numpy(),
+            "High": [105, 106],
+            "Low": [99, 100],
+            "Close": [104.25, 105.5],
+            "Volume": [1000, 1100],
+        },
+        index=idx,
+    )
+    df.index.name = "Date"
+    monkeypatch.setattr(market.yf, "download", lambda **_kwargs: {"AAPL": df})
+
+    out = market.fetch_stock_data(["AAPL"])["AAPL"]
+
+    assert len(out) == 1
+    for col in ("open", "high", "low", "close"):
+        assert out[col].dtype == np.float64
+    assert out["open"].iloc[0] == 100.5
+    assert out["volume"].dtype.kind == "i"
+
+
+def test_is_rate_limit_error_matches_messages_case_insensitively():
+    class YFRateLimitError(Exception):
+        pass
+
+    assert market._is_rate_limit_error(YFRateLimitError("boom"))
+    assert market._is_rate_limit_error(RuntimeError("429 Too Many Requests"))
+    assert market._is_rate_limit_error(RuntimeError("Rate Limit exceeded"))
+    assert not market._is_rate_limit_error(RuntimeError("no data found"))
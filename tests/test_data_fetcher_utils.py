@@ -2,6 +2,7 @@
 
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
 from analysis.data_fetcher_utils import (
@@ -74,6 +75,14 @@ def test_safe_decimal_and_decimal_to_string():
     assert _decimal_to_string(Decimal("10.50")) == "10.50"
 
 
+def test_safe_decimal_typed_inputs():
+    assert _safe_decimal(42) == Decimal("42")
+    assert _safe_decimal(0.1) == Decimal("0.1")
+    assert _safe_decimal(np.float64(2.5)) == Decimal("2.5")
+    assert _safe_decimal(float("nan")) is None
+    assert _safe_decimal(float("inf")) is None
+
+
 def test_compute_annual_from_quarters():
     reports = [
         {"fiscalDateEnding": "2023-03-31", "totalRevenue": "100", "reportedCurrency": "USD"},
@@ -89,6 +98,30 @@ def test_compute_annual_from_quarters():
     assert annual[0]["reportedCurrency"] == "USD"
 
 
+def test_compute_annual_from_quarters_unsorted_multi_year():
+    reports = [
+        {"fiscalDateEnding": f"{year}-{month}", "totalRevenue": str(value)}
+        for year, month, value in [
+            ("2023", "12-31", 4),
+            ("2022", "03-31", 10),
+            ("2023", "03-31", 1),
+            ("2022", "12-31", 40),
+            ("2023", "06-30", 2),
+            ("2022", "06-30", 20),
+            ("2023", "01-31", 1000),
+            ("2023", "09-30", 3),
+            ("2022", "09-30", 30),
+            ("2021", "12-31", 5),
+        ]
+    ]
+    reports.append({"fiscalDateEnding": "bad", "totalRevenue": "7"})
+
+    annual = _compute_annual_from_quarters(reports)
+
+    assert [r["fiscalDateEnding"] for r in annual] == ["2023-12-31", "2022-12-31"]
+    assert [r["totalRevenue"] for r in annual] == ["10", "100"]
+
+
 def test_compute_partial_year_reports():
     reports = [
         {"fiscalDateEnding": "2024-06-30", "totalRevenue": "200"},
@@ -106,3 +139,35 @@ def test_compute_partial_year_reports():
         assert report["quarterRange"] == "Q1-Q2"
         assert report["quarterCount"] == 2
         assert report["quartersIncluded"] == ["Q1", "Q2"]
+
+
+def test_aggregate_quarter_reports_sums_exact_decimal_strings():
+    from analysis.financials_helpers import aggregate_quarter_reports
+
+    reports = [
+        {"fiscalDateEnding": "2023-03-31", "reportedCurrency": "USD", "eps": "5.25",
+         "totalAssets": "9007199254740993", "otherIncome": "None", "label": "n/a"},
+        {"fiscalDateEnding": "2023-06-30", "eps": "5.25", "totalAssets": "9007199254740993",
+         "netIncome": "-40"},
+    ]
+
+    assert aggregate_quarter_reports(reports) == {
+        "eps": "10.50",
+        "totalAssets": "18014398509481986",
+        "otherIncome": "0",
+        "netIncome": "-40",
+        "reportedCurrency": "USD",
+    }
+
+
+def test_parse_non_negative_int_env(monkeypatch):
+    from analysis.data_fetcher_utils import parse_non_negative_int_env
+
+    monkeypatch.delenv("example_ttl_seconds", raising=False)
+    assert parse_non_negative_int_env("example_ttl_seconds", 30) == 30
+    monkeypatch.setenv("example_ttl_seconds", "12")
+    assert parse_non_negative_int_env("example_ttl_seconds", 30) == 12
+    monkeypatch.setenv("example_ttl_seconds", "-5")
+    assert parse_non_negative_int_env("example_ttl_seconds", 30) == 0
+    monkeypatch.setenv("example_ttl_seconds", "soon")
+    assert parse_non_negative_int_env("example_ttl_seconds", 30) == 30
@@ -38,3 +38,21 @@ def test_get_trading_period():
     assert period_str2 == 'No data'
     assert ip2 is None
     assert fp2 is None
+
+@patch('analysis.data_preparation.fetch_stock_data')
+def test_prepare_stock_data_multiple_symbols(mock_fetch):
+    def frame():
+        return pd.DataFrame({
+            'date': pd.date_range(start='2020-01-01', periods=25),
+            'close': [float(10 + (i % 5)) for i in range(25)],
+        })
+
+    mock_fetch.return_value = {'AAA': frame(), 'BBB': frame(), 'EMPTY': pd.DataFrame()}
+
+    data_dict = prepare_stock_data(['AAA', 'BBB', 'EMPTY'])
+
+    assert list(data_dict) == ['AAA', 'BBB', 'EMPTY']
+    for symbol in ('AAA', 'BBB'):
+        assert data_dict[symbol]['BB_upper'].notna().iloc[-1]
+        assert 'rsi' in data_dict[symbol].columns
+    assert data_dict['EMPTY'].empty
@@ -132,3 +132,55 @@ def test_find_short_term_low():
     # Next 3 days from index=1 => indices [1,2,3] => [9,8,11], the min is 8 at index=2
     assert idx == 2
     assert price == 8
+
+
+def test_process_bollinger_touches_alert_checks_latest_row_per_symbol():
+    def frame(high, low, upper, lower):
+        return pd.DataFrame({
+            'close': [10.0, 10.0],
+            'high': [10.5, high],
+            'low': [9.5, low],
+            'BB_upper': [12.0, upper],
+            'BB_lower': [8.0, lower],
+        })
+
+    data = {
+        'UP': frame(12.5, 9.0, 12.0, 8.0),
+        'DOWN': frame(11.0, 7.5, 12.0, 8.0),
+        'NONE': frame(11.0, 9.0, 12.0, 8.0),
+        'NAN': frame(12.5, 7.5, np.nan, 8.0),
+        'EMPTY': pd.DataFrame(),
+    }
+
+    alerts = process_bollinger_touches(data, mode='alert')
+
+    assert [(a['symbol'], a['touched_side']) for a in alerts] == [('UP', 'Upper'), ('DOWN', 'Lower')]
+    assert alerts[0]['high_price'] == 12.5
+    assert alerts[1]['recent_closes'] == [10.0, 10.0]
+
+
+def test_build_scan_snapshot_collects_last_row_arrays():
+    from analysis.event_detection import build_scan_snapshot
+
+    data = {
+        'AAA': pd.DataFrame({'close': [1.0, 2.0], 'high': [1.5, 2.5], 'low': [0.5, 1.5],
+                             'BB_upper': [3.0, 3.5], 'BB_lower': [0.0, 0.5]}),
+        'NOBANDS': pd.DataFrame({'close': [5.0], 'high': [6.0], 'low': [4.0]}),
+        'EMPTY': pd.DataFrame(),
+        'NONE': None,
+    }
+
+    snapshot = build_scan_snapshot(data)
+
+    assert snapshot['symbols'] == ['AAA', 'NOBANDS']
+    assert snapshot['close'].tolist() == [2.0, 5.0]
+    assert snapshot['BB_upper'][0] == 3.5
+    assert np.isnan(snapshot['BB_upper'][1])
+
+
+def test_list_tail_handles_float_and_object_series():
+    from analysis.event_detection import _list_tail
+
+    assert _list_tail(pd.Series([1.0, np.nan, 3.0]), n=2) == [None, 3.0]
+    assert _list_tail(pd.Series([1, None, 'x', 4], dtype=object)) == [1.0, None, None, 4.0]
+    assert _list_tail(pd.Series([1, 2, 3], dtype=np.int64), n=5) == [1.0, 2.0, 3.0]
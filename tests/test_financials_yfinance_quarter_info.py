@@ -24,7 +24,7 @@ def test_get_fiscal_quarter_info_uses_fiscal_year_end(monkeypatch):
         "mostRecentQuarter": _to_epoch(datetime(2025, 11, 30)),
         "lastFiscalYearEnd": _to_epoch(datetime(2025, 5, 31)),
     }
-    monkeypatch.setattr(financials_yfinance.yf, "Ticker", lambda _symbol: _FakeTicker(info))
+    monkeypatch.setattr(financials_yfinance, "get_ticker", lambda _symbol: _FakeTicker(info))
 
     result = financials_yfinance.get_fiscal_quarter_info("ORCL")
 
@@ -35,7 +35,7 @@ def test_get_fiscal_quarter_info_uses_fiscal_year_end(monkeypatch):
 
 def test_get_fiscal_quarter_info_falls_back_to_calendar(monkeypatch):
     info = {"mostRecentQuarter": _to_epoch(datetime(2024, 6, 30))}
-    monkeypatch.setattr(financials_yfinance.yf, "Ticker", lambda _symbol: _FakeTicker(info))
+    monkeypatch.setattr(financials_yfinance, "get_ticker", lambda _symbol: _FakeTicker(info))
 
     result = financials_yfinance.get_fiscal_quarter_info("AAPL")
 
@@ -43,3 +43,10 @@ def test_compare_metric():
     assert compare_metric(12, 10, "Trailing PE") == "Trailing PE is above peer average (12.00 vs. 10.00)."
     assert compare_metric(8, 10, "Trailing PE") == "Trailing PE is below (or near) peer average (8.00 vs. 10.00)."
     assert "No peer comparison" in compare_metric(None, 10, "Trailing PE")
+
+@patch('analysis.fundamentals.fetch_stock_fundamentals_bulk')
+def test_get_peers_fundamentals_uses_bulk_fetch(mock_bulk):
+    mock_bulk.return_value = {"SYM1": {"trailingPE": 8.0}}
+    result = get_peers_fundamentals(["SYM1", "SYM2"])
+    assert result == {"SYM1": {"trailingPE": 8.0}, "SYM2": {}}
+    mock_bulk.assert_called_once_with(["SYM1", "SYM2"])
@@ -19,3 +19,12 @@ def test_compute_rsi():
     assert 'rsi' in df.columns
     # Just ensure no NaNs in the tail
     assert not df['rsi'].tail(1).isna().any()
+
+def test_compute_bollinger_bands_stores_plain_float64():
+    df = pd.DataFrame({'close': pd.array([10, 11, 12, 13, 14, 15], dtype="Int64")})
+    df = compute_bollinger_bands(df, timeperiod=3, nbdevup=1, nbdevdn=1)
+    for col in ('BB_upper', 'BB_middle', 'BB_lower'):
+        assert df[col].dtype == np.float64
+    assert np.isnan(df['BB_upper'].iloc[0])
+    assert df['BB_middle'].iloc[-1] == 14.0
+    assert df['BB_upper'].iloc[-1] > df['BB_lower'].iloc[-1]
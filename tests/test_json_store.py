@@ -0,0 +1,64 @@
+# tests/test_json_store.py
+
+import analysis.data_fetcher_fundamentals as fundamentals
+import analysis.json_store as json_store
+
+
+def test_json_store_disabled_without_cache_dir(monkeypatch):
+    monkeypatch.delenv("JSON_CACHE_DIR", raising=False)
+    json_store.save("peers", "AAPL", ["MSFT"])
+    assert json_store.load("peers", "AAPL", 60) is None
+
+
+def test_json_store_round_trip_and_expiry(monkeypatch, tmp_path):
+    monkeypatch.setenv("JSON_CACHE_DIR", str(tmp_path))
+    now = [1_000.0]
+    monkeypatch.setattr(json_store.time, "time", lambda: now[0])
+
+    json_store.save("peers", "BRK/B", ["MSFT", "GOOG"])
+    json_store.save("peers", "EMPTY", [])
+
+    value, remaining = json_store.load("peers", "BRK/B", 60)
+    assert value == ["MSFT", "GOOG"]
+    assert remaining == 60
+    assert json_store.load("peers", "EMPTY", 60) is None
+    assert json_store.load("fundamentals", "BRK/B", 60) is None
+
+    now[0] += 61
+    assert json_store.load("peers", "BRK/B", 60) is None
+
+
+def test_fetch_peers_reads_through_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("JSON_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def _company_peers(symbol):
+        calls.append(symbol)
+        return ["MSFT", "GOOG"]
+
+    monkeypatch.setattr(fundamentals.finnhub_client, "company_peers", _company_peers)
+
+    assert fundamentals.fetch_peers("AAPL") == ["MSFT", "GOOG"]
+    fundamentals._clear_fundamentals_cache()
+    assert fundamentals.fetch_peers("AAPL") == ["MSFT", "GOOG"]
+    assert calls == ["AAPL"]
+
+    fundamentals.fetch_peers("AAPL", bypass_cache=True)
+    assert calls == ["AAPL", "AAPL"]
+
+
+def test_fetch_stock_fundamentals_reads_through_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("JSON_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def _load(candidate, include_alpha=True):
+        calls.append(candidate)
+        return {"trailingPE": 12.0}
+
+    monkeypatch.setattr(fundamentals, "load_fundamentals", _load)
+    monkeypatch.setattr(fundamentals, "is_empty_fundamentals", lambda payload: not payload)
+
+    assert fundamentals.fetch_stock_fundamentals("AAPL") == {"trailingPE": 12.0}
+    fundamentals._clear_fundamentals_cache()
+    assert fundamentals.fetch_stock_fundamentals("AAPL") == {"trailingPE": 12.0}
+    assert calls == ["AAPL"]
@@ -0,0 +1,178 @@
+# tests/test_ohlc_store.py
+
+import numpy as np
+import pandas as pd
+
+import analysis.data_fetcher_market as market
+import analysis.ohlc_store as ohlc_store
+
+
+def _bars(dates, closes):
+    frame = pd.DataFrame(
+        {
+            "Open": closes,
+            "High": [c + 1 for c in closes],
+            "Low": [c - 1 for c in closes],
+            "Close": closes,
+            "Volume": [100] * len(closes),
+        },
+        index=pd.DatetimeIndex(dates, name="Date"),
+    )
+    return frame
+
+
+def test_period_offset_parses_yfinance_periods():
+    assert ohlc_store.period_offset("5d") == pd.DateOffset(days=5)
+    assert ohlc_store.period_offset("4mo") == pd.DateOffset(months=4)
+    assert ohlc_store.period_offset("1y") == pd.DateOffset(years=1)
+    assert ohlc_store.period_offset("max") is None
+    assert ohlc_store.period_offset("ytd") is None
+
+
+def test_fetch_stock_data_appends_delta_to_stored_history(monkeypatch, tmp_path):
+    monkeypatch.setenv("OHLC_CACHE_DIR", str(tmp_path))
+    today = pd.Timestamp.now().normalize()
+    history_dates = pd.bdate_range(end=today - pd.Timedelta(days=1), periods=30)
+    history = _bars(history_dates, [float(i) for i in range(30)])
+    new_date = history_dates[-1] + pd.offsets.BDay(1)
+    delta = _bars(list(history_dates[-2:]) + [new_date], [28.0, 29.0, 30.0])
+    calls = []
+
+    def _fake_download(**kwargs):
+        calls.append(kwargs["period"])
+        return {"AAPL": history if kwargs["period"] == "1mo" else delta}
+
+    monkeypatch.setattr(market.yf, "download", _fake_download)
+
+    first = market.fetch_stock_data(["aapl"], period="1mo")["aapl"]
+    second = market.fetch_stock_data(["aapl"], period="1mo")["aapl"]
+
+    assert calls == ["1mo", ohlc_store.DELTA_PERIOD]
+    assert second["date"].iloc[-1] == new_date
+    assert second["close"].iloc[-1] == 30.0
+    assert second["date"].is_unique
+    assert second["date"].iloc[0] >= today - pd.DateOffset(months=1)
+    pd.testing.assert_frame_equal(
+        second.iloc[:-1].reset_index(drop=True),
+        first[first["date"] >= second["date"].iloc[0]].reset_index(drop=True),
+    )
+
+
+def test_fetch_stock_data_refetches_when_stored_closes_changed(monkeypatch, tmp_path):
+    monkeypatch.setenv("OHLC_CACHE_DIR", str(tmp_path))
+    today = pd.Timestamp.now().normalize()
+    history_dates = pd.bdate_range(end=today - pd.Timedelta(days=1), periods=30)
+    history = _bars(history_dates, [float(i) for i in range(30)])
+    adjusted = _bars(history_dates[-2:], [27.5, 28.5])
+    calls = []
+
+    def _fake_download(**kwargs):
+        calls.append(kwargs["period"])
+        return {"AAPL": history if kwargs["period"] == "1mo" else adjusted}
+
+    monkeypatch.setattr(market.yf, "download", _fake_download)
+
+    market.fetch_stock_data("AAPL", period="1mo")
+    result = market.fetch_stock_data("AAPL", period="1mo")["AAPL"]
+
+    assert calls == ["1mo", ohlc_store.DELTA_PERIOD, "1mo"]
+    np.testing.assert_allclose(result["close"].to_numpy()[-2:], [28.0, 29.0])
+
+
+
+def test_fetch_stock_data_replaces_moving_last_bar_without_refetch(monkeypatch, tmp_path):
+    monkeypatch.setenv("OHLC_CACHE_DIR", str(tmp_path))
+    today = pd.Timestamp.now().normalize()
+    history_dates = pd.bdate_range(end=today, periods=30)
+    closes = [float(i) for i in range(30)]
+    calls = []
+
+    def _fake_download(**kwargs):
+        calls.append(kwargs["period"])
+        if kwargs["period"] == "1mo":
+            return {"AAPL": _bars(history_dates, closes)}
+        # Only today's partial bar moves between downloads.
+        live_close = 29.0 + len(calls) / 10
+        return {"AAPL": _bars(history_dates[-3:], [27.0, 28.0, live_close])}
+
+    monkeypatch.setattr(market.yf, "download", _fake_download)
+
+    for _ in range(4):
+        result = market.fetch_stock_data("AAPL", period="1mo")["AAPL"]
+
+    assert calls == ["1mo"] + [ohlc_store.DELTA_PERIOD] * 3
+    assert result["close"].iloc[-1] == 29.4
+    assert result["date"].is_unique
+
+
+def test_fetch_stock_data_keeps_longer_history_across_periods(monkeypatch, tmp_path):
+    monkeypatch.setenv("OHLC_CACHE_DIR", str(tmp_path))
+    today = pd.Timestamp.now().normalize()
+    history_dates = pd.bdate_range(end=today - pd.Timedelta(days=1), periods=260)
+    history = _bars(history_dates, [float(i) for i in range(260)])
+    delta = _bars(history_dates[-2:], [258.0, 259.0])
+    calls = []
+
+    def _fake_download(**kwargs):
+        calls.append(kwargs["period"])
+        return {"AAPL": history if kwargs["period"] == "1y" else delta}
+
+    monkeypatch.setattr(market.yf, "download", _fake_download)
+
+    market.fetch_stock_data("AAPL", period="1y")
+    short = market.fetch_stock_data("AAPL", period="4mo")["AAPL"]
+    long = market.fetch_stock_data("AAPL", period="1y")["AAPL"]
+
+    assert calls == ["1y", ohlc_store.DELTA_PERIOD, ohlc_store.DELTA_PERIOD]
+    assert short["date"].iloc[0] >= today - pd.DateOffset(months=4)
+    assert long["date"].iloc[0] < today - pd.DateOffset(months=11)
+
+
+def test_fetch_stock_data_without_cache_dir_does_not_touch_disk(monkeypatch, tmp_path):
+    monkeypatch.delenv("OHLC_CACHE_DIR", raising=False)
+    monkeypatch.chdir(tmp_path)
+    dates = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=3)
+    monkeypatch.setattr(market.yf, "download", lambda **_kwargs: {"AAPL": _bars(dates, [1.0, 2.0, 3.0])})
+
+    result = market.fetch_stock_data("AAPL")
+
+    assert result["AAPL"]["close"].tolist() == [1.0, 2.0, 3.0]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fetch_stock_data_serves_fresh_store_without_download(monkeypatch, tmp_path):
+    monkeypatch.setenv("OHLC_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("OHLC_CACHE_MAX_AGE_SECONDS", "900")
+    today = pd.Timestamp.now().normalize()
+    history_dates = pd.bdate_range(end=today - pd.Timedelta(days=1), periods=30)
+    history = _bars(history_dates, [float(i) for i in range(30)])
+    calls = []
+
+    def _fake_download(**kwargs):
+        calls.append(kwargs["period"])
+        return {"AAPL": history}
+
+    monkeypatch.setattr(market.yf, "download", _fake_download)
+
+    first = market.fetch_stock_data(["AAPL"], period="1mo")["AAPL"]
+    second = market.fetch_stock_data(["AAPL"], period="1mo")["AAPL"]
+
+    assert calls == ["1mo"]
+    pd.testing.assert_frame_equal(second, ohlc_store.trim(first, "1mo"))
+
+    monkeypatch.setenv("OHLC_CACHE_MAX_AGE_SECONDS", "0")
+    market.fetch_stock_data(["AAPL"], period="1mo")
+    assert calls == ["1mo", ohlc_store.DELTA_PERIOD]
+
+
+def test_save_round_trips_without_leaving_temp_files(monkeypatch, tmp_path):
+    monkeypatch.setenv("OHLC_CACHE_DIR", str(tmp_path))
+    frame = pd.DataFrame(
+        {"date": pd.date_range("2024-01-01", periods=3), "close": [1.0, 2.0, 3.0]}
+    )
+
+    ohlc_store.save("AAPL", "1d", False, frame)
+    ohlc_store.save("AAPL", "1d", False, frame)
+
+    pd.testing.assert_frame_equal(ohlc_store.load("AAPL", "1d", False), frame)
+    assert not list(tmp_path.rglob("*.tmp"))
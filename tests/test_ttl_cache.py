@@ -0,0 +1,43 @@
+# tests/test_ttl_cache.py
+
+import analysis.ttl_cache as ttl_cache
+from analysis.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_entries_per_ttl(monkeypatch):
+    clock = {"now": 100.0}
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: clock["now"])
+    cache = TTLCache(ttl_seconds=60)
+
+    cache.set("long", 1)
+    cache.set("short", 2, ttl=5)
+    cache.set("skipped", 3, ttl=0)
+
+    assert cache.get("long") == 1
+    assert cache.get("short") == 2
+    assert cache.get("skipped") is None
+
+    clock["now"] += 5
+    assert cache.get("short", "miss") == "miss"
+    assert cache.get("long") == 1
+
+    clock["now"] += 55
+    assert cache.get("long") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(ttl_seconds=60, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    cache.discard("a")
+    cache.discard("missing")
+    assert cache.get("a") is None
+    assert len(cache) == 1
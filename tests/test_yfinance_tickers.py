@@ -0,0 +1,23 @@
+# tests/test_yfinance_tickers.py
+
+import analysis.yfinance_tickers as yfinance_tickers
+
+
+def test_get_ticker_reuses_object_within_ttl_window(monkeypatch):
+    created = []
+
+    def _fake_ticker(symbol):
+        created.append(symbol)
+        return object()
+
+    clock = {"now": 1_000.0}
+    monkeypatch.setattr(yfinance_tickers.yf, "Ticker", _fake_ticker)
+    monkeypatch.setattr(yfinance_tickers.time, "time", lambda: clock["now"])
+
+    first = yfinance_tickers.get_ticker("AAPL")
+    assert yfinance_tickers.get_ticker("AAPL") is first
+    assert yfinance_tickers.get_ticker("MSFT") is not first
+
+    clock["now"] += yfinance_tickers._TICKER_TTL_SECONDS
+    assert yfinance_tickers.get_ticker("AAPL") is not first
+    assert created == ["AAPL", "MSFT", "AAPL"]